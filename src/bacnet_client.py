@@ -3,12 +3,24 @@ BACnet Client Wrapper for E2E Testing
 Provides a clean interface for BACnet operations
 """
 import logging
-from typing import Optional, Any, Dict
+from operator import attrgetter
+from typing import Optional, Any, Callable, Dict
 import BAC0
 from BAC0.core.devices.Points import NumericPoint
 
 logger = logging.getLogger(__name__)
 
+# BACnet property names readable from a BAC0 point, mapped to the point attribute holding them
+_POINT_ATTRIBUTES = {
+    "presentValue": "lastValue",
+    "objectName": "properties.name",
+    "description": "properties.description",
+    "units": "properties.units_state",
+    "priorityArray": "properties.priority_array",
+    "statusFlags": "properties.status_flags",
+}
+_VALID_PROPS = frozenset(_POINT_ATTRIBUTES)
+
 
 class BACnetClient:
     """Wrapper for BACnet operations using BAC0 library"""
@@ -40,14 +52,17 @@ class BACnetClient:
         self.bacnet = None
         self.device = None
         
+        # Attribute getters, built once per property name
+        self._attrgetters: Dict[str, Callable[[Any], Any]] = {}
+        
     def connect(self) -> None:
         """Establish connection to BACnet network"""
         try:
-            logger.info(f"Connecting to BACnet network on {self.local_ip}")
+            logger.info("Connecting to BACnet network on %s", self.local_ip)
             
             # Initialize BAC0 with local IP
             if self.bbmd_address:
-                logger.info(f"Registering as foreign device with BBMD: {self.bbmd_address}")
+                logger.info("Registering as foreign device with BBMD: %s", self.bbmd_address)
                 self.bacnet = BAC0.connect(
                     ip=self.local_ip,
                     bbmdAddress=self.bbmd_address,
@@ -59,17 +74,17 @@ class BACnetClient:
             logger.info("BACnet network connection established")
             
             # Discover and connect to device
-            logger.info(f"Discovering device at {self.device_ip} with ID {self.device_id}")
+            logger.info("Discovering device at %s with ID %s", self.device_ip, self.device_id)
             device_address = f"{self.device_ip}:{self.device_id}"
             self.device = BAC0.device(device_address, self.device_id, self.bacnet)
             
             if self.device:
-                logger.info(f"Successfully connected to device: {self.device.properties.name}")
+                logger.info("Successfully connected to device: %s", self.device.properties.name)
             else:
                 raise ConnectionError(f"Failed to connect to device {device_address}")
                 
         except Exception as e:
-            logger.error(f"Failed to connect to BACnet network: {e}")
+            logger.error("Failed to connect to BACnet network: %s", e)
             raise
     
     def disconnect(self) -> None:
@@ -82,7 +97,7 @@ class BACnetClient:
                 self.device = None
                 logger.info("Disconnected successfully")
         except Exception as e:
-            logger.error(f"Error during disconnect: {e}")
+            logger.error("Error during disconnect: %s", e)
             raise
     
     def read_analog_value(self, instance: int) -> float:
@@ -96,17 +111,17 @@ class BACnetClient:
             Current present value
         """
         try:
-            logger.info(f"Reading AnalogValue:{instance}")
+            logger.info("Reading AnalogValue:%s", instance)
             
             # Read using BAC0
             point_name = f"analogValue:{instance}"
             value = self.device[point_name]
             
-            logger.info(f"Read AnalogValue:{instance} = {value}")
+            logger.info("Read AnalogValue:%s = %s", instance, value)
             return float(value)
             
         except Exception as e:
-            logger.error(f"Failed to read AnalogValue:{instance}: {e}")
+            logger.error("Failed to read AnalogValue:%s: %s", instance, e)
             raise
     
     def write_analog_value(self, instance: int, value: float, priority: int = 8) -> None:
@@ -119,16 +134,16 @@ class BACnetClient:
             priority: Write priority (1-16, default 8)
         """
         try:
-            logger.info(f"Writing {value} to AnalogValue:{instance} at priority {priority}")
+            logger.info("Writing %s to AnalogValue:%s at priority %s", value, instance, priority)
             
             # Write using BAC0
             point_name = f"analogValue:{instance}"
             self.device[point_name] = value
             
-            logger.info(f"Successfully wrote {value} to AnalogValue:{instance}")
+            logger.info("Successfully wrote %s to AnalogValue:%s", value, instance)
             
         except Exception as e:
-            logger.error(f"Failed to write to AnalogValue:{instance}: {e}")
+            logger.error("Failed to write to AnalogValue:%s: %s", instance, e)
             raise
     
     def read_property(
@@ -149,7 +164,12 @@ class BACnetClient:
             Property value
         """
         try:
-            logger.info(f"Reading {object_type}:{instance}.{property_name}")
+            logger.info("Reading %s:%s.%s", object_type, instance, property_name)
+            
+            if property_name not in _VALID_PROPS:
+                raise ValueError(
+                    f"Unsupported property {property_name!r}, expected one of {sorted(_VALID_PROPS)}"
+                )
             
             # Construct point name
             point_name = f"{object_type}:{instance}"
@@ -161,13 +181,16 @@ class BACnetClient:
                 raise ValueError(f"Point {point_name} not found")
             
             # Read property
-            value = point.properties.__dict__.get(property_name)
+            getter = self._attrgetters.get(property_name)
+            if getter is None:
+                getter = self._attrgetters[property_name] = attrgetter(_POINT_ATTRIBUTES[property_name])
+            value = getter(point)
             
-            logger.info(f"Read {object_type}:{instance}.{property_name} = {value}")
+            logger.info("Read %s:%s.%s = %s", object_type, instance, property_name, value)
             return value
             
         except Exception as e:
-            logger.error(f"Failed to read property: {e}")
+            logger.error("Failed to read property: %s", e)
             raise
     
     def get_device_info(self) -> Dict[str, Any]:
@@ -189,11 +212,11 @@ class BACnetClient:
                 "description": self.device.properties.description,
             }
             
-            logger.info(f"Device info: {info}")
+            logger.info("Device info: %s", info)
             return info
             
         except Exception as e:
-            logger.error(f"Failed to get device info: {e}")
+            logger.error("Failed to get device info: %s", e)
             raise
     
     def __enter__(self):
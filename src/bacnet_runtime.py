@@ -0,0 +1,123 @@
+"""
+Shared Event Loop for BACnet Clients
+Runs a single asyncio event loop in a background thread per process and
+keeps released BACnet stacks bound for the next client on the same interface
+"""
+import asyncio
+import atexit
+import logging
+import threading
+from typing import Any, Dict, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_LOOP_THREAD: Optional[threading.Thread] = None
+_LOCK = threading.Lock()
+
+# Connected BAC0 stacks not owned by any client, keyed by network settings
+_STACK_POOL: Dict[Hashable, Any] = {}
+
+
+def _run_event_loop(loop: asyncio.AbstractEventLoop, started: threading.Event) -> None:
+    """Run event loop in separate thread"""
+    asyncio.set_event_loop(loop)
+    loop.call_soon(started.set)
+    
+    logger.info("Event loop started in separate thread")
+    
+    try:
+        loop.run_forever()
+    finally:
+        loop.close()
+        logger.info("Event loop closed")
+
+
+def get_loop(timeout: float = 5) -> asyncio.AbstractEventLoop:
+    """
+    Return the shared event loop, starting its thread on first use
+    
+    Args:
+        timeout: Seconds to wait for the loop to start
+    
+    Returns:
+        Running event loop shared by all clients in this process
+    """
+    global _LOOP, _LOOP_THREAD
+    
+    with _LOCK:
+        if _LOOP_THREAD is None or not _LOOP_THREAD.is_alive():
+            loop = asyncio.new_event_loop()
+            started = threading.Event()
+            thread = threading.Thread(
+                target=_run_event_loop,
+                args=(loop, started),
+                name="bacnet-event-loop",
+                daemon=True
+            )
+            thread.start()
+            
+            if not started.wait(timeout):
+                raise RuntimeError("Failed to start event loop")
+            
+            _LOOP, _LOOP_THREAD = loop, thread
+            logger.info("Event loop thread started successfully")
+        
+        return _LOOP
+
+
+def acquire_stack(key: Hashable) -> Optional[Any]:
+    """
+    Take a pooled BACnet stack
+    
+    Args:
+        key: Network settings the stack was connected with
+    
+    Returns:
+        Connected BAC0 instance, or None if none is pooled for ``key``
+    """
+    with _LOCK:
+        return _STACK_POOL.pop(key, None)
+
+
+def release_stack(key: Hashable, stack: Any) -> bool:
+    """
+    Return a connected BACnet stack to the pool
+    
+    Args:
+        key: Network settings the stack was connected with
+        stack: Connected BAC0 instance
+    
+    Returns:
+        True if the stack was pooled, False if the caller must disconnect it
+    """
+    with _LOCK:
+        if key in _STACK_POOL:
+            return False
+        _STACK_POOL[key] = stack
+        return True
+
+
+async def _disconnect(stack: Any) -> None:
+    """Disconnect a BACnet stack on the event loop it runs on"""
+    await stack.disconnect()
+
+
+@atexit.register
+def close_stacks(timeout: float = 5) -> None:
+    """
+    Disconnect every pooled BACnet stack
+    
+    Args:
+        timeout: Seconds to wait for each stack to close its socket
+    """
+    with _LOCK:
+        stacks = list(_STACK_POOL.values())
+        _STACK_POOL.clear()
+    
+    for stack in stacks:
+        try:
+            # BAC0 disconnect() creates a task, so it must be called on the loop itself
+            asyncio.run_coroutine_threadsafe(_disconnect(stack), _LOOP).result(timeout=timeout)
+        except Exception as e:
+            logger.warning("Failed to close pooled BACnet stack: %s", e)
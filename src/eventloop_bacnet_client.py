@@ -2,23 +2,158 @@
 BACnet Client with Proper Event Loop Management
 Handles asyncio event loop for BAC0 library
 """
+import json
 import logging
+import os
 import time
+import random
 import asyncio
+import tempfile
 import threading
-from typing import Optional, Any, Dict
+from math import ceil, isclose
+from collections import defaultdict, deque
+from concurrent.futures import Future
+from typing import Optional, Any, Awaitable, Callable, Dict, List, Literal, Tuple
+
+from src.bacnet_runtime import acquire_stack, get_loop, release_stack
 
 logger = logging.getLogger(__name__)
 
-try:
-    import BAC0
-except ImportError as e:
-    logger.error(f"Failed to import BAC0: {e}")
-    raise
+# BAC0 pulls in bacpypes3 and pandas, so it is imported on first connect
+_BAC0 = None
+
+
+def _lazy_bac0():
+    """Import BAC0 on first use and return the module"""
+    global _BAC0
+    if _BAC0 is None:
+        try:
+            import BAC0
+        except ImportError as e:
+            logger.error("Failed to import BAC0: %s", e)
+            raise
+        _BAC0 = BAC0
+    return _BAC0
+
+# Default number of properties packed into one ReadPropertyMultiple request
+DEFAULT_POINTS_PER_REQUEST = 25
+
+# Number of successful requests before probing a larger chunk size again
+CAP_PROBE_INTERVAL = 50
+
+# File used to remember learned chunk sizes between sessions
+CAPS_CACHE_FILE = ".bacnet_caps.json"
+
+# File used to remember device address bindings between sessions
+DEVICE_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "pytest-bacnet", "devices.json")
+
+# Seconds to wait for the BACnet stack to announce itself after connecting
+CONNECT_READY_TIMEOUT = 5
+
+# Upper bound in seconds for collecting I-Am responses to a Who-Is
+WHOIS_TIMEOUT = 3
+
+# Who-Is ends early once no new I-Am has arrived for this many seconds
+WHOIS_SETTLE_TIME = 0.5
+
+# How Who-Is requests are addressed
+DiscoveryMode = Literal["broadcast", "multicast", "directed"]
+DISCOVERY_MODES = ("broadcast", "multicast", "directed")
+
+# Maximum number of ReadProperty requests in flight at once
+DEFAULT_MAX_CONCURRENT_READS = 8
+
+# Milliseconds a queued presentValue read waits for others to share its request
+DEFAULT_MAX_BATCH_LATENCY_MS = 5
+
+# Attempts per read or write, and the base delay in seconds doubled after each failed attempt
+DEFAULT_RETRY_COUNT = 3
+DEFAULT_RETRY_DELAY = 0.5
+
+# Seconds a synchronous call waits for a single attempt of its BACnet operation
+REQUEST_TIMEOUT = 10
+
+# Abort reasons caused by a busy or unreachable device, worth another attempt
+RETRYABLE_ABORT_REASONS = ("no-response", "tsm-timeout", "server-timeout", "out-of-resources")
+
+# Abort reasons meaning a request or its response is too large for the device
+APDU_SIZE_ABORT_REASONS = ("apdu-too-long", "buffer-overflow")
+
+# Lifetime in seconds requested for COV subscriptions
+COV_LIFETIME = 900
+
+# Seconds a presentValue received by COV notification is served without a read
+COV_MAX_AGE = 1.0
+
+# Number of objectList entries requested per ReadRange page
+OBJECT_LIST_PAGE_SIZE = 100
+
+# Maximum number of WriteProperty requests in flight when WritePropertyMultiple is unsupported
+DEFAULT_MAX_CONCURRENT_WRITES = 4
+
+# Device object properties returned by get_device_info, keyed by info field
+DEVICE_INFO_PROPERTIES = {
+    "name": "objectName",
+    "vendor": "vendorName",
+    "model": "modelName",
+    "description": "description",
+}
+
+# Seconds a read property value stays cached; unlisted properties are not cached
+PROPERTY_CACHE_TTL = {
+    "presentValue": 0,
+    "units": 3600,
+    "objectName": 3600,
+    "description": 3600,
+    "vendorName": 86400,
+    "modelName": 86400,
+}
+
+
+def _load_json_cache(path: Optional[str]) -> Dict[str, Any]:
+    """Load a JSON cache file, returning an empty dict if it is missing or unreadable"""
+    if not path or not os.path.exists(path):
+        return {}
+    
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning("Ignoring unreadable cache file %s: %s", path, e)
+        return {}
+
+
+def _save_json_cache(path: Optional[str], data: Dict[str, Any]) -> None:
+    """
+    Write a JSON cache file atomically, creating its directory if needed
+    
+    The data goes to a temporary file that then replaces the cache file, so
+    concurrent writers such as pytest-xdist workers never leave a partial file.
+    """
+    if not path:
+        return
+    
+    directory = os.path.dirname(path) or "."
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f"{os.path.basename(path)}.", suffix=".tmp")
+    except OSError as e:
+        logger.warning("Failed to write cache file %s: %s", path, e)
+        return
+    
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning("Failed to write cache file %s: %s", path, e)
+    finally:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
 
 
 class EventLoopBACnetClient:
-    """BACnet client that manages its own event loop in a separate thread"""
+    """BACnet client that runs BAC0 on a shared event loop in a separate thread"""
     
     def __init__(
         self,
@@ -26,7 +161,20 @@ class EventLoopBACnetClient:
         device_ip: str,
         device_id: int,
         bbmd_address: Optional[str] = None,
-        bbmd_ttl: int = 900
+        bbmd_ttl: int = 900,
+        points_per_request: int = DEFAULT_POINTS_PER_REQUEST,
+        caps_cache_file: Optional[str] = CAPS_CACHE_FILE,
+        poll_rate: int = 0,
+        device_cache_file: Optional[str] = DEVICE_CACHE_FILE,
+        refresh_device_cache: bool = False,
+        discovery_mode: DiscoveryMode = "broadcast",
+        multicast_address: Optional[str] = None,
+        max_batch_size: int = DEFAULT_POINTS_PER_REQUEST,
+        max_batch_latency_ms: float = DEFAULT_MAX_BATCH_LATENCY_MS,
+        pooled: bool = True,
+        retry_count: int = DEFAULT_RETRY_COUNT,
+        retry_delay: float = DEFAULT_RETRY_DELAY,
+        local_port: Optional[int] = None
     ):
         """
         Initialize BACnet client with event loop management
@@ -37,123 +185,495 @@ class EventLoopBACnetClient:
             device_id: Target device ID
             bbmd_address: Optional BBMD address
             bbmd_ttl: Time to live for BBMD registration
+            points_per_request: Maximum properties per ReadPropertyMultiple request
+            caps_cache_file: File storing learned chunk sizes (None disables it)
+            poll_rate: Seconds between background polls of the device points;
+                0 disables polling and every read goes on the wire
+            device_cache_file: File storing device address bindings (None disables it)
+            refresh_device_cache: Ignore the cached binding and rediscover the device
+            discovery_mode: How whois() addresses Who-Is requests: 'broadcast' to
+                the local network, 'multicast' to ``multicast_address``, or
+                'directed' unicast to each device in the device cache
+            multicast_address: Multicast group (e.g. '239.255.0.1:47808') used
+                in 'multicast' discovery mode
+            max_batch_size: Maximum number of concurrent presentValue reads
+                combined into one ReadPropertyMultiple request; 1 disables batching
+            max_batch_latency_ms: Milliseconds a read waits for others to join
+                its batch while an earlier request is still in flight
+            pooled: Keep the BACnet stack bound after disconnect so the next
+                client on the same interface reuses its socket
+            retry_count: Attempts per read or write before a timeout is raised
+            retry_delay: Seconds before the first retry, doubled for each further one
+            local_port: Local UDP port to bind (None binds BAC0's default 47808);
+                clients running in parallel processes need distinct ports
         """
+        if discovery_mode not in DISCOVERY_MODES:
+            raise ValueError(
+                f"Invalid discovery mode {discovery_mode!r}, expected one of {DISCOVERY_MODES}"
+            )
+        if discovery_mode == "multicast" and not multicast_address:
+            raise ValueError("Multicast discovery requires a multicast_address")
+        
         self.local_ip = local_ip
+        self.local_port = local_port
         self.device_ip = device_ip
         self.device_id = device_id
         self.bbmd_address = bbmd_address
         self.bbmd_ttl = bbmd_ttl
         
+        self.poll_rate = poll_rate
+        self.device_cache_file = device_cache_file
+        self.refresh_device_cache = refresh_device_cache
+        self.discovery_mode = discovery_mode
+        self.multicast_address = multicast_address
+        self.pooled = pooled
+        
+        # Retries of timed out reads and writes with exponential backoff
+        self.retry_count = max(1, retry_count)
+        self.retry_delay = retry_delay
+        self.operation_timeout = REQUEST_TIMEOUT * self.retry_count + sum(
+            retry_delay * 2 ** attempt + 0.1 for attempt in range(self.retry_count - 1)
+        )
+        
+        # BAC0 request strings, built once per (object_type, instance, property)
+        self._requests: Dict[Tuple[str, int, str], str] = {}
+        
+        # bacpypes3 object and property identifiers, built once per (object_type, instance, property)
+        self._identifiers: Dict[Tuple[str, int, str], Tuple[Any, Any]] = {}
+        
+        # bacpypes3 Address of the device, resolved on connect
+        self._addr = None
+        
         self.bacnet = None
+        self.device = None
         self.device_address = f"{self.device_ip}:{self.device_id}"
         
-        # Event loop management
-        self.loop = None
-        self.loop_thread = None
-        self._stop_event = threading.Event()
+        # ReadPropertyMultiple chunk sizing, learned per device address
+        self.points_per_request = points_per_request
+        self.caps_cache_file = caps_cache_file
+        self._max_points_per_request: Dict[str, int] = {
+            address: int(cap) for address, cap in _load_json_cache(caps_cache_file).items()
+        }
+        self._cap_successes: Dict[str, int] = {}
         
-    def _run_event_loop(self):
-        """Run event loop in separate thread"""
-        self.loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(self.loop)
+        # Property values keyed by (device_address, object_type, instance, property_name)
+        self._prop_cache: Dict[Tuple[str, str, int, str], Tuple[Any, float]] = {}
         
-        logger.info("Event loop started in separate thread")
+        # Queued presentValue reads waiting to be sent as one batch
+        self.max_batch_size = max_batch_size
+        self.max_batch_latency_ms = max_batch_latency_ms
+        self._pending: deque = deque()
+        self._batch_timer: Optional[asyncio.TimerHandle] = None
+        self._outstanding_batches = 0
+        
+        # Latest AnalogValue presentValues from COV notifications: instance -> (value, received at)
+        self.cov_cache: Dict[int, Tuple[float, float]] = {}
+        # Set whenever a COV notification updates the instance's cov_cache entry
+        self.cov_events: Dict[int, threading.Event] = defaultdict(threading.Event)
+        self._cov_subscriptions: Dict[int, int] = {}
+        # Values written to subscribed AnalogValues that no COV notification has reported yet
+        self._cov_expected: Dict[int, float] = {}
+        
+        # Hot-path presentValue reads handed from caller threads to the reader worker
+        self._read_queue: Optional[asyncio.Queue] = None
+        self._reader_task: Optional[asyncio.Task] = None
+        
+        # Device addresses that rejected WritePropertyMultiple
+        self._wpm_unsupported = set()
+        
+        # Event loop shared by every client in this process
+        self.loop = get_loop()
         
-        try:
-            self.loop.run_forever()
-        finally:
-            self.loop.close()
-            logger.info("Event loop closed")
-    
-    def _start_event_loop(self):
-        """Start event loop in background thread"""
-        if self.loop_thread is None or not self.loop_thread.is_alive():
-            self.loop_thread = threading.Thread(target=self._run_event_loop, daemon=True)
-            self.loop_thread.start()
-            
-            # Wait for loop to be ready
-            timeout = 5
-            start_time = time.time()
-            while self.loop is None and (time.time() - start_time) < timeout:
-                time.sleep(0.1)
-            
-            if self.loop is None:
-                raise RuntimeError("Failed to start event loop")
-            
-            logger.info("Event loop thread started successfully")
-    
-    def _stop_event_loop(self):
-        """Stop the event loop"""
-        if self.loop and self.loop.is_running():
-            self.loop.call_soon_threadsafe(self.loop.stop)
-            
-            if self.loop_thread:
-                self.loop_thread.join(timeout=5)
-    
     def connect(self) -> None:
         """Establish connection to BACnet network"""
         try:
-            # Start event loop first
-            self._start_event_loop()
+            logger.info("Connecting to BACnet network on %s", self.local_ip)
             
-            logger.info(f"Connecting to BACnet network on {self.local_ip}")
+            # Reuse a stack left bound by an earlier client on this interface
+            if self.pooled:
+                self.bacnet = acquire_stack(self._stack_key)
             
-            # Create BAC0 instance in the event loop
-            future = asyncio.run_coroutine_threadsafe(
-                self._async_connect(),
-                self.loop
-            )
+            if self.bacnet:
+                logger.info("Reusing BACnet stack on %s", self.local_ip)
+            else:
+                # Create BAC0 instance in the event loop
+                self.bacnet = self._run_coroutine(self._async_connect())
+                
+                # Wait for the network stack to initialize
+                self._run_coroutine(self._post_init(), timeout=CONNECT_READY_TIMEOUT + 1)
             
-            # Wait for connection with timeout
-            self.bacnet = future.result(timeout=10)
+            logger.info("BACnet network connection established")
+            logger.info("Device address: %s", self.device_address)
             
-            # Give network time to initialize
-            time.sleep(2)
+            from bacpypes3.pdu import Address
+            self._addr = Address(self.device_address)
             
-            logger.info("BACnet network connection established")
-            logger.info(f"Device address: {self.device_address}")
+            # Skip Who-Is discovery of the target device when its binding is known
+            if not self.refresh_device_cache:
+                self._run_coroutine(self._bind_cached_device())
+            
+            if self.poll_rate > 0:
+                self._start_polling()
+            
+            self._run_coroutine(self._start_reader())
             
         except Exception as e:
-            logger.error(f"Failed to connect to BACnet network: {e}")
-            self._stop_event_loop()
+            logger.error("Failed to connect to BACnet network: %s", e)
             raise
     
+    @property
+    def _stack_key(self) -> Tuple[str, Optional[int], Optional[str], int]:
+        """Network settings identifying a reusable BACnet stack"""
+        return (self.local_ip, self.local_port, self.bbmd_address, self.bbmd_ttl)
+    
+    def _run_coroutine(self, coro, timeout: Optional[float] = None) -> Any:
+        """
+        Run a coroutine on the client event loop and wait for its result
+        
+        Args:
+            coro: Coroutine to schedule on the background loop
+            timeout: Seconds to wait for the result (defaults to the time
+                needed for every attempt of a retried operation)
+            
+        Returns:
+            Result of the coroutine
+        """
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        return future.result(timeout=timeout or self.operation_timeout)
+    
+    async def _retry(self, operation: Callable[[], Awaitable[Any]], description: str, *args) -> Any:
+        """
+        Await an operation, retrying timeouts with exponential backoff and jitter
+        
+        Errors other than timeouts, such as unknown objects or properties,
+        are raised on the first attempt. Retrying also stops when the next
+        attempt could not start within ``operation_timeout``, the time
+        synchronous callers wait for the result.
+        
+        Args:
+            operation: Function returning a new awaitable for each attempt
+            description: Log message describing the operation, %-formatted with ``args``
+            
+        Returns:
+            Result of the first successful attempt
+        """
+        from bacpypes3.errors import CommuncationError, NoResponse, ServerTimeout, TSMTimeout
+        from BAC0.core.io.IOExceptions import NoResponseFromController, Timeout
+        
+        retryable = (
+            asyncio.TimeoutError, Timeout, NoResponseFromController,
+            CommuncationError, NoResponse, ServerTimeout, TSMTimeout
+        )
+        
+        deadline = time.monotonic() + self.operation_timeout
+        for attempt in range(self.retry_count):
+            try:
+                return await operation()
+            except retryable as e:
+                delay = self.retry_delay * 2 ** attempt + random.random() * 0.1
+                if attempt == self.retry_count - 1 or time.monotonic() + delay >= deadline:
+                    raise
+                logger.warning(
+                    "%s failed (%r), retrying in %.2fs", description % args, e, delay
+                )
+                await asyncio.sleep(delay)
+    
+    async def _post_init(self) -> None:
+        """Wait until BAC0 has started its application and sent its I-Am"""
+        async def _wait_initialized():
+            while not getattr(self.bacnet, "_initialized", True):
+                await asyncio.sleep(0.05)
+        
+        try:
+            await asyncio.wait_for(_wait_initialized(), timeout=CONNECT_READY_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.warning("BACnet stack not ready after %ss, continuing", CONNECT_READY_TIMEOUT)
+    
+    async def _bind_cached_device(self) -> None:
+        """Load the cached device binding into the bacpypes3 device info cache"""
+        from bacpypes3.apdu import IAmRequest
+        from bacpypes3.basetypes import Segmentation
+        from bacpypes3.pdu import Address
+        
+        devices = _load_json_cache(self.device_cache_file)
+        entry = devices.get(self.device_address)
+        if not entry:
+            return
+        
+        try:
+            if entry.get("device_id") != self.device_id:
+                return
+            i_am = IAmRequest(
+                iAmDeviceIdentifier=("device", self.device_id),
+                maxAPDULengthAccepted=entry["max_apdu_length_accepted"],
+                segmentationSupported=Segmentation(entry["segmentation_supported"]),
+                vendorID=entry["vendor_identifier"]
+            )
+            i_am.pduSource = Address(entry["address"])
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
+            # A stale or hand-edited entry is dropped and the device discovered again
+            logger.warning("Dropping invalid cached binding of %s: %r", self.device_address, e)
+            del devices[self.device_address]
+            _save_json_cache(self.device_cache_file, devices)
+            return
+        
+        await self.bacnet.this_application.app.device_info_cache.set_device_info(i_am)
+        logger.info("Using cached binding for device %s at %s", self.device_id, entry['address'])
+    
+    async def _save_device_binding(self, info: Dict[str, Any]) -> None:
+        """Persist the device binding learned by bacpypes3 along with its info"""
+        # Only complete bindings are saved, a property that failed to read is retried next session
+        if any(value is None or value == "Unknown" for value in info.values()):
+            logger.info("Not caching binding of %s, device info is incomplete", self.device_address)
+            return
+        
+        device_info_cache = self.bacnet.this_application.app.device_info_cache
+        device_info = await device_info_cache.get_device_info(self.device_id)
+        if device_info is None:
+            return
+        
+        devices = _load_json_cache(self.device_cache_file)
+        devices[self.device_address] = {
+            **{key: str(value) for key, value in info.items() if key != "device_id"},
+            "device_id": self.device_id,
+            "address": str(device_info.device_address),
+            "max_apdu_length_accepted": int(device_info.max_apdu_length_accepted),
+            "segmentation_supported": str(device_info.segmentation_supported),
+            "vendor_identifier": device_info.vendor_identifier,
+        }
+        _save_json_cache(self.device_cache_file, devices)
+    
+    def _start_polling(self) -> None:
+        """Create a BAC0 device that polls all its points in the background"""
+        logger.info("Polling %s every %ss", self.device_address, self.poll_rate)
+        
+        # Building the point list reads the whole object list, allow extra time
+        self.device = self._run_coroutine(
+            _lazy_bac0().device(
+                self.device_address,
+                self.device_id,
+                self.bacnet,
+                poll=self.poll_rate
+            ),
+            timeout=60
+        )
+    
+    def _cached_point(self, object_type: str, instance: int) -> Optional[Any]:
+        """Return the polled BAC0 point for an object, or None when not polling"""
+        if self.device is None:
+            return None
+        return self.device[(object_type, instance)]
+    
+    async def _start_reader(self) -> None:
+        """Create the read queue and start the reader worker on the event loop"""
+        self._read_queue = asyncio.Queue()
+        self._reader_task = asyncio.create_task(self._reader_worker())
+    
+    async def _reader_worker(self) -> None:
+        """Start a read for every queued request, handing results back to its caller"""
+        while True:
+            instance, done, out = await self._read_queue.get()
+            task = asyncio.create_task(self.aread_analog_value(instance))
+            task.add_done_callback(
+                lambda task, done=done, out=out: self._complete_read(task, done, out)
+            )
+    
+    @staticmethod
+    def _complete_read(task: asyncio.Task, done: threading.Event, out: list) -> None:
+        """Store the outcome of a queued read and wake the waiting thread"""
+        if task.cancelled():
+            out.append(asyncio.CancelledError())
+        elif task.exception() is not None:
+            out.append(task.exception())
+        else:
+            out.append(task.result())
+        done.set()
+    
     async def _async_connect(self):
         """Async connection method"""
+        BAC0 = _lazy_bac0()
+        
         if self.bbmd_address:
-            logger.info(f"Connecting with BBMD: {self.bbmd_address}")
+            logger.info("Connecting with BBMD: %s", self.bbmd_address)
             bacnet = BAC0.connect(
                 ip=self.local_ip,
+                port=self.local_port,
                 bbmdAddress=self.bbmd_address,
                 bbmdTTL=self.bbmd_ttl
             )
         else:
-            bacnet = BAC0.lite(ip=self.local_ip)
+            bacnet = BAC0.lite(ip=self.local_ip, port=self.local_port)
         
         return bacnet
     
     def disconnect(self) -> None:
         """Disconnect from BACnet network"""
         try:
+            if self._reader_task:
+                self.loop.call_soon_threadsafe(self._reader_task.cancel)
+                self._reader_task = None
+                self._read_queue = None
+            
+            if self._cov_subscriptions:
+                self._run_coroutine(self._async_cancel_cov())
+            
+            if self.device:
+                # BAC0 stops polling by cancelling an asyncio task, which must happen on its loop
+                self._run_coroutine(self._async_stop_polling())
+                self.device = None
+            
             if self.bacnet:
-                logger.info("Disconnecting from BACnet network")
-                
-                # Disconnect BAC0
-                self.bacnet.disconnect()
+                if self.pooled and release_stack(self._stack_key, self.bacnet):
+                    logger.info("Released BACnet stack on %s for reuse", self.local_ip)
+                else:
+                    logger.info("Disconnecting from BACnet network")
+                    
+                    # Disconnect BAC0 and wait until its socket is closed
+                    self._run_coroutine(self._async_disconnect())
+                    
+                    logger.info("Disconnected from BACnet")
                 self.bacnet = None
-                
-                logger.info("Disconnected from BACnet")
-            
-            # Stop event loop
-            self._stop_event_loop()
             
         except Exception as e:
-            logger.error(f"Error during disconnect: {e}")
+            logger.error("Error during disconnect: %s", e)
+    
+    async def _async_stop_polling(self) -> None:
+        """Stop polling the device points (coroutine)"""
+        self.device.poll(command="stop")
+    
+    async def _async_disconnect(self) -> None:
+        """Async disconnection method"""
+        await self.bacnet.disconnect()
+    
+    def _request(self, object_type: str, instance: int, property_name: str) -> str:
+        """Return the BAC0 request string for a property of the target device"""
+        key = (object_type, instance, property_name)
+        request = self._requests.get(key)
+        if request is None:
+            request = self._requests[key] = (
+                f"{self.device_address} {object_type} {instance} {property_name}"
+            )
+        return request
+    
+    def _identifier(self, object_type: str, instance: int, property_name: str) -> Tuple[Any, Any]:
+        """Return the bacpypes3 object and property identifiers for a property"""
+        key = (object_type, instance, property_name)
+        identifiers = self._identifiers.get(key)
+        if identifiers is None:
+            from bacpypes3.primitivedata import ObjectIdentifier, PropertyIdentifier
+            identifiers = self._identifiers[key] = (
+                ObjectIdentifier(f"{object_type}:{instance}"),
+                PropertyIdentifier(property_name)
+            )
+        return identifiers
+    
+    async def _read(self, object_type: str, instance: int, property_name: str) -> Any:
+        """
+        Read a property with bacpypes3, addressing the pre-resolved device Address
+        
+        Skips BAC0's request string parsing on hot-path reads. Timeouts are
+        retried with backoff.
+        
+        Returns:
+            Property value
+        """
+        from bacpypes3.apdu import ErrorRejectAbortNack
+        from BAC0.core.io.IOExceptions import (
+            NoResponseFromController, ReadPropertyException, UnknownObjectError, UnknownPropertyError
+        )
+        
+        object_identifier, property_identifier = self._identifier(object_type, instance, property_name)
+        
+        async def _read_once():
+            try:
+                response = await self.bacnet.this_application.app.read_property(
+                    self._addr, object_identifier, property_identifier
+                )
+            except ErrorRejectAbortNack as err:
+                response = err
+            
+            if isinstance(response, ErrorRejectAbortNack):
+                reason = str(response)
+                if "unknown-object" in reason:
+                    raise UnknownObjectError(f"Unknown object {object_type}:{instance}")
+                if "unknown-property" in reason:
+                    raise UnknownPropertyError(f"Unknown property {object_type}:{instance}.{property_name}")
+                if any(retryable in reason for retryable in RETRYABLE_ABORT_REASONS):
+                    raise NoResponseFromController(f"APDU Abort Reason : {reason}")
+                raise ReadPropertyException(f"APDU Abort Reason : {reason}")
+            return response
+        
+        return await self._retry(_read_once, "Read %s:%s.%s", object_type, instance, property_name)
+    
+    async def _write(
+        self,
+        object_type: str,
+        instance: int,
+        property_name: str,
+        value: Any,
+        priority: Optional[int] = None
+    ) -> Any:
+        """
+        Write a property with bacpypes3, addressing the pre-resolved device Address
+        
+        Skips BAC0's request string parsing on hot-path writes. Timeouts are
+        retried with backoff.
+        
+        Returns:
+            Write response
+        """
+        from bacpypes3.apdu import ErrorRejectAbortNack
+        from BAC0.core.io.IOExceptions import NoResponseFromController, WritePropertyException
+        
+        object_identifier, property_identifier = self._identifier(object_type, instance, property_name)
+        
+        async def _write_once():
+            try:
+                return await self.bacnet.this_application.app.write_property(
+                    self._addr, object_identifier, property_identifier, value, None, priority
+                )
+            except ErrorRejectAbortNack as err:
+                reason = str(err)
+                if any(retryable in reason for retryable in RETRYABLE_ABORT_REASONS):
+                    raise NoResponseFromController(f"APDU Abort Reason : {reason}")
+                raise WritePropertyException(f"APDU Abort Reason : {reason}")
+        
+        return await self._retry(
+            _write_once, "Write %s to %s:%s.%s", value, object_type, instance, property_name
+        )
     
     def read_analog_value(self, instance: int) -> float:
         """
         Read present value from an AnalogValue object
         
+        Args:
+            instance: Instance number of the AnalogValue object
+            
+        Returns:
+            Current present value
+        """
+        if self._read_queue is None:
+            return self._run_coroutine(self.aread_analog_value(instance))
+        
+        # Hand the read to the reader worker and block on a plain event
+        done = threading.Event()
+        out = []
+        self.loop.call_soon_threadsafe(self._read_queue.put_nowait, (instance, done, out))
+        
+        if not done.wait(timeout=self.operation_timeout):
+            raise TimeoutError(f"Timed out reading AnalogValue:{instance}")
+        
+        result = out[0]
+        if isinstance(result, BaseException):
+            raise result
+        return result
+    
+    async def aread_analog_value(self, instance: int) -> float:
+        """
+        Read present value from an AnalogValue object (coroutine)
+        
+        Must be awaited on the client event loop (``self.loop``).
+        
         Args:
             instance: Instance number of the AnalogValue object
             
@@ -164,27 +684,70 @@ class EventLoopBACnetClient:
             if not self.bacnet:
                 raise ConnectionError("Not connected to BACnet network")
             
-            logger.info(f"Reading AnalogValue:{instance} from {self.device_address}")
+            logger.info("Reading AnalogValue:%s from %s", instance, self.device_address)
+            
+            # Serve a recent COV notification without a read
+            entry = self.cov_cache.get(instance)
+            if entry is not None and time.monotonic() - entry[1] < COV_MAX_AGE:
+                logger.info("Read AnalogValue:%s = %s (COV)", instance, entry[0])
+                return entry[0]
             
-            # Use BAC0 read method
-            request = f"{self.device_address} analogValue {instance} presentValue"
+            # Serve from the polled value when available
+            point = self._cached_point("analogValue", instance)
+            if point is not None and point.lastValue is not None:
+                logger.info("Read AnalogValue:%s = %s (polled)", instance, point.lastValue)
+                return float(point.lastValue)
             
-            value = self.bacnet.read(request)
+            # Queue the read so concurrent callers share one request
+            value = await self._submit_read(("analogValue", instance, "presentValue"))
             
             if value is None:
                 raise ValueError(f"Failed to read AnalogValue:{instance} - got None response")
             
-            logger.info(f"Read AnalogValue:{instance} = {value}")
+            logger.info("Read AnalogValue:%s = %s", instance, value)
             return float(value)
             
         except Exception as e:
-            logger.error(f"Failed to read AnalogValue:{instance}: {e}")
+            logger.error("Failed to read AnalogValue:%s: %s", instance, e)
             raise
     
     def write_analog_value(self, instance: int, value: float, priority: int = 8) -> None:
         """
         Write present value to an AnalogValue object
         
+        Args:
+            instance: Instance number of the AnalogValue object
+            value: Value to write
+            priority: Write priority (1-16, default 8)
+        """
+        self._run_coroutine(self.awrite_analog_value(instance, value, priority))
+    
+    def write_analog_value_nowait(self, instance: int, value: float, priority: int = 8) -> Future:
+        """
+        Send a write to an AnalogValue object without waiting for its acknowledgement
+        
+        Writes sent back-to-back are pipelined instead of paying one round trip
+        each. Failures are logged when they occur; call ``result()`` on the
+        returned future to confirm the write.
+        
+        Args:
+            instance: Instance number of the AnalogValue object
+            value: Value to write
+            priority: Write priority (1-16, default 8)
+            
+        Returns:
+            Future resolved once the device acknowledges the write
+        """
+        return asyncio.run_coroutine_threadsafe(
+            self.awrite_analog_value(instance, value, priority), self.loop
+        )
+    
+    async def awrite_analog_value(self, instance: int, value: float, priority: int = 8) -> None:
+        """
+        Write present value to an AnalogValue object (coroutine)
+        
+        Must be awaited on the client event loop (``self.loop``).
+        
         Args:
             instance: Instance number of the AnalogValue object
             value: Value to write
@@ -194,19 +757,111 @@ class EventLoopBACnetClient:
             if not self.bacnet:
                 raise ConnectionError("Not connected to BACnet network")
             
-            logger.info(f"Writing {value} to AnalogValue:{instance} at priority {priority}")
+            logger.info("Writing %s to AnalogValue:%s at priority %s", value, instance, priority)
+            
+            self._expect_cov_value(instance, value)
+            
+            # Await the acknowledgement of the write
+            result = await self._write("analogValue", instance, "presentValue", value, priority)
+            self._invalidate_cached_object("analogValue", instance)
+            
+            logger.info("Write result: %s", result)
+            logger.info("Successfully wrote %s to AnalogValue:%s", value, instance)
             
-            # Use BAC0 write method
-            request = f"{self.device_address} analogValue {instance} presentValue {value} - {priority}"
+            # Record the written value so reads see it before the next poll confirms it
+            point = self._cached_point("analogValue", instance)
+            if point is not None:
+                point._trend(float(value))
             
-            result = self.bacnet.write(request)
+        except Exception as e:
+            self._cov_expected.pop(instance, None)
+            logger.error("Failed to write to AnalogValue:%s: %s", instance, e)
+            raise
+    
+    def _submit_read(self, request: Tuple[str, int, str]) -> "asyncio.Future":
+        """
+        Queue a property read for the next batch
+        
+        A read is sent right away when no batch is in flight. While the device
+        is busy, reads accumulate until ``max_batch_size`` are queued or
+        ``max_batch_latency_ms`` has elapsed, and then go out together.
+        
+        Args:
+            request: (object_type, instance, property_name) tuple
+            
+        Returns:
+            Future resolved with the property value
+        """
+        future = self.loop.create_future()
+        self._pending.append((request, future))
+        
+        if len(self._pending) >= self.max_batch_size or self._outstanding_batches == 0:
+            self._flush_pending()
+        elif self._batch_timer is None:
+            self._batch_timer = self.loop.call_later(
+                self.max_batch_latency_ms / 1000, self._flush_pending
+            )
+        
+        return future
+    
+    def _flush_pending(self) -> None:
+        """Send the queued reads as one batch"""
+        if self._batch_timer is not None:
+            self._batch_timer.cancel()
+            self._batch_timer = None
+        
+        size = min(
+            self.max_batch_size,
+            self._max_points_per_request.get(self.device_address, self.points_per_request)
+        )
+        batch = [self._pending.popleft() for _ in range(min(size, len(self._pending)))]
+        if batch:
+            self._outstanding_batches += 1
+            self.loop.create_task(self._read_batch(batch))
+    
+    async def _read_batch(self, batch: List[Tuple[Tuple[str, int, str], "asyncio.Future"]]) -> None:
+        """Read a batch of queued requests and resolve their futures"""
+        from BAC0.core.io.IOExceptions import APDUError, SegmentationNotSupported, UnrecognizedService
+        
+        requests = [request for request, _ in batch]
+        try:
+            if len(requests) == 1:
+                results = [await self._read(*requests[0])]
+            else:
+                logger.info("Reading %s queued properties in one request", len(requests))
+                try:
+                    results = await self._async_read_multiple_chunk(requests)
+                except (SegmentationNotSupported, APDUError, UnrecognizedService) as e:
+                    logger.warning("Batched read rejected (%r), reading properties one by one", e)
+                    results = await asyncio.gather(
+                        *[self._read(*request) for request in requests],
+                        return_exceptions=True
+                    )
             
-            logger.info(f"Write result: {result}")
-            logger.info(f"Successfully wrote {value} to AnalogValue:{instance}")
+            for (_, future), result in zip(batch, results):
+                if future.done():
+                    continue
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
             
         except Exception as e:
-            logger.error(f"Failed to write to AnalogValue:{instance}: {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            
+        except asyncio.CancelledError:
+            # Waiters would otherwise block until their own timeout
+            for _, future in batch:
+                future.cancel()
             raise
+            
+        finally:
+            self._outstanding_batches -= 1
+            # The device is free again, send whatever queued up meanwhile
+            if self._pending:
+                self._flush_pending()
     
     def read_property(
         self,
@@ -217,6 +872,27 @@ class EventLoopBACnetClient:
         """
         Read a specific property from a BACnet object
         
+        Args:
+            object_type: Object type (e.g., 'analogValue', 'analogInput')
+            instance: Instance number
+            property_name: Property name (e.g., 'presentValue', 'units')
+            
+        Returns:
+            Property value
+        """
+        return self._run_coroutine(self.aread_property(object_type, instance, property_name))
+    
+    async def aread_property(
+        self,
+        object_type: str,
+        instance: int,
+        property_name: str
+    ) -> Any:
+        """
+        Read a specific property from a BACnet object (coroutine)
+        
+        Must be awaited on the client event loop (``self.loop``).
+        
         Args:
             object_type: Object type (e.g., 'analogValue', 'analogInput')
             instance: Instance number
@@ -229,45 +905,715 @@ class EventLoopBACnetClient:
             if not self.bacnet:
                 raise ConnectionError("Not connected to BACnet network")
             
-            logger.info(f"Reading {object_type}:{instance}.{property_name}")
+            logger.info("Reading %s:%s.%s", object_type, instance, property_name)
             
-            request = f"{self.device_address} {object_type} {instance} {property_name}"
+            value = self._get_cached_property(object_type, instance, property_name)
+            if value is not None:
+                logger.info("Read %s:%s.%s = %s (cached)", object_type, instance, property_name, value)
+                return value
             
-            value = self.bacnet.read(request)
+            request = self._request(object_type, instance, property_name)
             
-            logger.info(f"Read {object_type}:{instance}.{property_name} = {value}")
+            value = await self._retry(
+                lambda: self.bacnet.read(request), "Read %s:%s.%s", object_type, instance, property_name
+            )
+            self._cache_property(object_type, instance, property_name, value)
+            
+            logger.info("Read %s:%s.%s = %s", object_type, instance, property_name, value)
             return value
             
         except Exception as e:
-            logger.error(f"Failed to read property: {e}")
+            logger.error("Failed to read property: %s", e)
+            raise
+    
+    def _get_cached_property(self, object_type: str, instance: int, property_name: str) -> Any:
+        """Return a cached property value, or None when missing or expired"""
+        key = (self.device_address, object_type, instance, property_name)
+        entry = self._prop_cache.get(key)
+        if entry is None:
+            return None
+        
+        value, expire_at = entry
+        if time.monotonic() >= expire_at:
+            del self._prop_cache[key]
+            return None
+        return value
+    
+    def _cache_property(self, object_type: str, instance: int, property_name: str, value: Any) -> None:
+        """Cache a property value for its PROPERTY_CACHE_TTL; failed reads are never cached"""
+        from bacpypes3.basetypes import ErrorType
+        
+        ttl = PROPERTY_CACHE_TTL.get(property_name, 0)
+        if ttl > 0 and value is not None and not isinstance(value, ErrorType):
+            key = (self.device_address, object_type, instance, property_name)
+            self._prop_cache[key] = (value, time.monotonic() + ttl)
+    
+    def _invalidate_cached_object(self, object_type: str, instance: int) -> None:
+        """Drop every cached property of an object after it was written"""
+        point = (self.device_address, object_type, instance)
+        for key in [key for key in self._prop_cache if key[:3] == point]:
+            del self._prop_cache[key]
+    
+    def _expect_cov_value(self, instance: int, value: Any) -> None:
+        """
+        Drop the COV value of an AnalogValue about to be written
+        
+        Until a notification reports the written value, notifications are
+        ignored, so a late one carrying the old value is never served. Must
+        be called on the client event loop, where notifications arrive.
+        """
+        if instance in self._cov_subscriptions:
+            self._cov_expected[instance] = float(value)
+        self.cov_cache.pop(instance, None)
+    
+    def _set_cap(self, cap: int) -> None:
+        """Remember the chunk size accepted by the current device"""
+        if self._max_points_per_request.get(self.device_address) != cap:
+            self._max_points_per_request[self.device_address] = cap
+            _save_json_cache(self.caps_cache_file, self._max_points_per_request)
+    
+    def read_multiple(
+        self,
+        requests: List[Tuple[str, int, str]],
+        points_per_request: Optional[int] = None
+    ) -> List[Any]:
+        """
+        Read several properties using ReadPropertyMultiple
+        
+        Requests are split into chunks and each chunk is sent as a single
+        BACnet transaction. The chunk size starts at the size learned for the
+        device and is halved whenever the device rejects a request as too
+        large. Every CAP_PROBE_INTERVAL successful requests a chunk one
+        property larger is tried, up to ``points_per_request``. Devices
+        without ReadPropertyMultiple are read property by property.
+        
+        Args:
+            requests: List of (object_type, instance, property_name) tuples
+            points_per_request: Maximum number of properties per request
+                (defaults to the client setting)
+            
+        Returns:
+            List of values in the same order as ``requests``
+        """
+        try:
+            if not self.bacnet:
+                raise ConnectionError("Not connected to BACnet network")
+            
+            logger.info("Reading %s properties from %s", len(requests), self.device_address)
+            
+            from BAC0.core.io.IOExceptions import APDUError, SegmentationNotSupported, UnrecognizedService
+            
+            max_points = points_per_request or self.points_per_request
+            cap = min(
+                self._max_points_per_request.get(self.device_address, max_points),
+                max_points
+            )
+            
+            results = []
+            index = 0
+            while index < len(requests):
+                size = cap
+                successes = self._cap_successes.get(self.device_address, 0)
+                if cap < max_points and successes >= CAP_PROBE_INTERVAL:
+                    size = cap + 1
+                    self._cap_successes[self.device_address] = 0
+                
+                chunk = requests[index:index + size]
+                try:
+                    results.extend(self._read_multiple_chunk(chunk))
+                except UnrecognizedService as e:
+                    logger.warning("ReadPropertyMultiple failed (%r), reading properties one by one", e)
+                    remaining = requests[index:]
+                    results.extend(self._run_coroutine(
+                        self._async_read_each(remaining),
+                        timeout=ceil(len(remaining) / DEFAULT_MAX_CONCURRENT_READS) * self.operation_timeout
+                    ))
+                    break
+                except (SegmentationNotSupported, APDUError) as e:
+                    if len(chunk) == 1:
+                        raise
+                    if size > cap:
+                        # Probe for a larger chunk failed, keep the known good size
+                        logger.info("Device rejected %s properties per request (%r)", size, e)
+                        continue
+                    cap = max(1, len(chunk) // 2)
+                    self._set_cap(cap)
+                    logger.warning(
+                        "Request of %s properties rejected (%r), using %s properties per request",
+                        len(chunk), e, cap
+                    )
+                    continue
+                
+                if size > cap and len(chunk) == size:
+                    cap = size
+                    self._set_cap(cap)
+                self._cap_successes[self.device_address] = (
+                    self._cap_successes.get(self.device_address, 0) + 1
+                )
+                index += len(chunk)
+            
+            logger.info("Read %s properties from %s", len(results), self.device_address)
+            return results
+            
+        except Exception as e:
+            logger.error("Failed to read multiple properties: %s", e)
+            raise
+    
+    async def _async_read_each(self, requests: List[Tuple[str, int, str]]) -> List[Any]:
+        """Read properties with overlapping ReadProperty requests, None for those the device rejects"""
+        from BAC0.core.io.IOExceptions import ReadPropertyException, UnknownObjectError, UnknownPropertyError
+        
+        semaphore = asyncio.Semaphore(DEFAULT_MAX_CONCURRENT_READS)
+        
+        async def _read(object_type, instance, property_name):
+            async with semaphore:
+                try:
+                    return await self._read(object_type, instance, property_name)
+                except (ReadPropertyException, UnknownObjectError, UnknownPropertyError):
+                    return None
+        
+        return await asyncio.gather(*[_read(*request) for request in requests])
+    
+    def _read_multiple_chunk(self, chunk: List[Tuple[str, int, str]]) -> List[Any]:
+        """Send one ReadPropertyMultiple request and map values back to the chunk order"""
+        return self._run_coroutine(self._async_read_multiple_chunk(chunk))
+    
+    async def _async_read_multiple_chunk(self, chunk: List[Tuple[str, int, str]]) -> List[Any]:
+        """
+        Send one ReadPropertyMultiple request (coroutine)
+        
+        Properties the device could not read are returned as None.
+        Raises SegmentationNotSupported or APDUError only when the device
+        rejects the request as too large, so callers can shrink the chunk
+        size. Timeouts are retried with backoff and raised as
+        NoResponseFromController.
+        """
+        from bacpypes3.apdu import ErrorRejectAbortNack
+        from bacpypes3.basetypes import ErrorType
+        from BAC0.core.io.IOExceptions import (
+            APDUError, NoResponseFromController, ReadPropertyMultipleException,
+            SegmentationNotSupported, UnrecognizedService
+        )
+        
+        # One (object, [properties]) pair per object, properties in request order
+        objects: Dict[Any, List[Any]] = {}
+        for request in chunk:
+            object_identifier, property_identifier = self._identifier(*request)
+            properties = objects.setdefault(object_identifier, [])
+            if property_identifier not in properties:
+                properties.append(property_identifier)
+        parameter_list = [item for pair in objects.items() for item in pair]
+        
+        app = self.bacnet.this_application.app
+        
+        async def _read_once():
+            try:
+                return await app.read_property_multiple(self._addr, list(parameter_list))
+            except ErrorRejectAbortNack as err:
+                reason = str(err)
+                if "segmentation-not-supported" in reason:
+                    raise SegmentationNotSupported(reason)
+                if any(too_large in reason for too_large in APDU_SIZE_ABORT_REASONS):
+                    raise APDUError(f"APDU Abort Reason : {reason}")
+                if "unrecognized-service" in reason:
+                    raise UnrecognizedService(reason)
+                if any(retryable in reason for retryable in RETRYABLE_ABORT_REASONS):
+                    raise NoResponseFromController(f"APDU Abort Reason : {reason}")
+                raise ReadPropertyMultipleException(f"APDU Abort Reason : {reason}")
+        
+        response = await self._retry(
+            _read_once, "ReadPropertyMultiple of %s properties from %s", len(chunk), self.device_address
+        )
+        
+        # A property the device failed to read comes back as an ErrorType, returned as None
+        values = {
+            (object_identifier, property_identifier): None if isinstance(value, ErrorType) else value
+            for object_identifier, property_identifier, _, value in response
+        }
+        return [values.get(self._identifier(*request)) for request in chunk]
+    
+    def read_many_parallel(
+        self,
+        requests: List[Tuple[str, int, str]],
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT_READS,
+        timeout: float = 30
+    ) -> List[Any]:
+        """
+        Read several properties with overlapping ReadProperty requests
+        
+        Useful for devices without ReadPropertyMultiple support. The number of
+        requests in flight is limited by ``max_concurrent`` because devices
+        with a single transaction buffer drop overlapping requests.
+        
+        Args:
+            requests: List of (object_type, instance, property_name) tuples
+            max_concurrent: Maximum number of requests in flight
+            timeout: Seconds to wait for all reads to complete
+            
+        Returns:
+            List of values in the same order as ``requests``; a failed read
+            is returned as its exception instead of a value
+        """
+        try:
+            if not self.bacnet:
+                raise ConnectionError("Not connected to BACnet network")
+            
+            logger.info(
+                "Reading %s properties from %s with up to %s requests in flight",
+                len(requests), self.device_address, max_concurrent
+            )
+            
+            async def _read_all():
+                semaphore = asyncio.Semaphore(max_concurrent)
+                
+                async def _read(object_type, instance, property_name):
+                    async with semaphore:
+                        return await self._read(object_type, instance, property_name)
+                
+                return await asyncio.gather(
+                    *[_read(*request) for request in requests],
+                    return_exceptions=True
+                )
+            
+            results = self._run_coroutine(_read_all(), timeout=timeout)
+            
+            if logger.isEnabledFor(logging.INFO):
+                failures = sum(isinstance(result, Exception) for result in results)
+                logger.info("Read %s/%s properties successfully", len(results) - failures, len(results))
+            return results
+            
+        except Exception as e:
+            logger.error("Failed to read properties in parallel: %s", e)
+            raise
+    
+    def write_multiple(self, writes: List[Tuple[str, int, Any, int]]) -> None:
+        """
+        Write presentValue of several objects using WritePropertyMultiple
+        
+        Writes are split into chunks of ``points_per_request`` and each chunk
+        is sent as a single BACnet transaction. Devices that reject the
+        service are remembered and written with overlapping WriteProperty
+        requests instead.
+        
+        Args:
+            writes: List of (object_type, instance, value, priority) tuples
+        """
+        try:
+            if not self.bacnet:
+                raise ConnectionError("Not connected to BACnet network")
+            
+            logger.info("Writing %s values to %s", len(writes), self.device_address)
+            
+            chunks = ceil(len(writes) / self.points_per_request)
+            self._run_coroutine(
+                self._async_write_chunks(writes), timeout=chunks * max(30, self.operation_timeout)
+            )
+            
+            logger.info("Successfully wrote %s values to %s", len(writes), self.device_address)
+            
+        except Exception as e:
+            logger.error("Failed to write multiple values: %s", e)
+            raise
+    
+    async def _async_write_chunks(self, writes: List[Tuple[str, int, Any, int]]) -> None:
+        """
+        Write values chunk by chunk, falling back to WriteProperty if needed
+        
+        Runs on the client event loop, like the COV callback and batched
+        reads that share the property and COV caches.
+        """
+        for object_type, instance, value, _ in writes:
+            self._invalidate_cached_object(object_type, instance)
+            if object_type == "analogValue":
+                self._expect_cov_value(instance, value)
+        
+        try:
+            for index in range(0, len(writes), self.points_per_request):
+                chunk = writes[index:index + self.points_per_request]
+                if self.device_address in self._wpm_unsupported:
+                    await self._async_write_each(chunk)
+                    continue
+                
+                if not await self._async_write_multiple(chunk):
+                    logger.warning(
+                        "%s does not support WritePropertyMultiple, falling back to WriteProperty",
+                        self.device_address
+                    )
+                    self._wpm_unsupported.add(self.device_address)
+                    await self._async_write_each(chunk)
+        except BaseException:
+            for object_type, instance, _, _ in writes:
+                if object_type == "analogValue":
+                    self._cov_expected.pop(instance, None)
+            raise
+    
+    async def _async_write_multiple(self, writes: List[Tuple[str, int, Any, int]]) -> bool:
+        """
+        Send one WritePropertyMultiple request
+        
+        Returns:
+            False if the device does not support the service, True on success
+        """
+        from bacpypes3.apdu import ErrorRejectAbortNack, SimpleAckPDU, WritePropertyMultipleRequest
+        from bacpypes3.basetypes import PropertyValue, WriteAccessSpecification
+        from bacpypes3.constructeddata import Any as AnyValue
+        from bacpypes3.primitivedata import ObjectIdentifier
+        from BAC0.core.io.IOExceptions import NoResponseFromController, WritePropertyException
+        
+        app = self.bacnet.this_application.app
+        vendor_info = await app.get_vendor_info(device_address=self._addr)
+        
+        # Group property values per object, one WriteAccessSpecification each
+        specs: Dict[str, List[Any]] = {}
+        for object_type, instance, value, priority in writes:
+            object_identifier, property_identifier = self._identifier(object_type, instance, "presentValue")
+            object_class = vendor_info.get_object_class(object_identifier[0])
+            property_type = object_class.get_property_type(property_identifier)
+            
+            property_value = PropertyValue(
+                propertyIdentifier=property_identifier,
+                value=AnyValue(property_type(value))
+            )
+            if priority is not None:
+                property_value.priority = priority
+            specs.setdefault(str(object_identifier), []).append(property_value)
+        
+        request = WritePropertyMultipleRequest(
+            listOfWriteAccessSpecs=[
+                WriteAccessSpecification(
+                    objectIdentifier=ObjectIdentifier(object_identifier),
+                    listOfProperties=property_values
+                )
+                for object_identifier, property_values in specs.items()
+            ],
+            destination=self._addr
+        )
+        
+        async def _write_once():
+            try:
+                response = await app.request(request)
+            except ErrorRejectAbortNack as err:
+                response = err
+            
+            if isinstance(response, ErrorRejectAbortNack):
+                reason = str(response)
+                if "unrecognized-service" in reason:
+                    return False
+                if any(retryable in reason for retryable in RETRYABLE_ABORT_REASONS):
+                    raise NoResponseFromController(f"APDU Abort Reason : {reason}")
+                raise WritePropertyException(f"APDU Abort Reason : {reason}")
+            if not isinstance(response, SimpleAckPDU):
+                raise WritePropertyException(f"Unexpected response : {response!r}")
+            return True
+        
+        return await self._retry(
+            _write_once, "WritePropertyMultiple of %s values to %s", len(writes), self.device_address
+        )
+    
+    async def _async_write_each(self, writes: List[Tuple[str, int, Any, int]]) -> None:
+        """Write values with overlapping WriteProperty requests"""
+        semaphore = asyncio.Semaphore(DEFAULT_MAX_CONCURRENT_WRITES)
+        
+        async def _write(object_type, instance, value, priority):
+            async with semaphore:
+                return await self._write(object_type, instance, "presentValue", value, priority)
+        
+        await asyncio.gather(*[_write(*write) for write in writes])
+    
+    def subscribe_cov(self, instance: int, lifetime: int = COV_LIFETIME) -> None:
+        """
+        Subscribe to COV notifications of an AnalogValue object
+        
+        Notified presentValues are kept in ``cov_cache`` and served by
+        read_analog_value() for COV_MAX_AGE seconds without a read. Each
+        notification also sets ``cov_events[instance]``. After a write,
+        notifications are ignored until one reports the written value.
+        
+        Args:
+            instance: Instance number of the AnalogValue object
+            lifetime: Seconds the device keeps the subscription
+        """
+        try:
+            if not self.bacnet:
+                raise ConnectionError("Not connected to BACnet network")
+            
+            if instance in self._cov_subscriptions:
+                return
+            
+            logger.info("Subscribing to COV of AnalogValue:%s on %s", instance, self.device_address)
+            self._run_coroutine(self._async_subscribe_cov(instance, lifetime))
+            
+        except Exception as e:
+            logger.error("Failed to subscribe to COV of AnalogValue:%s: %s", instance, e)
             raise
     
+    async def _async_subscribe_cov(self, instance: int, lifetime: int) -> None:
+        """Start a BAC0 COV subscription task (coroutine)"""
+        def _on_cov(property_identifier, property_value):
+            if property_identifier.attr == "presentValue":
+                value = float(property_value)
+                expected = self._cov_expected.get(instance)
+                if expected is not None:
+                    # Notification of a value from before the last write
+                    if not isclose(value, expected, rel_tol=1e-6, abs_tol=1e-6):
+                        return
+                    del self._cov_expected[instance]
+                self.cov_cache[instance] = (value, time.monotonic())
+                self.cov_events[instance].set()
+        
+        self.bacnet.cov(
+            self.device_address,
+            ("analogValue", instance),
+            lifetime=lifetime,
+            callback=_on_cov
+        )
+        
+        # BAC0 numbers subscriptions sequentially and does not return the id
+        self._cov_subscriptions[instance] = self.bacnet._last_cov_identifier
+    
+    async def _async_cancel_cov(self) -> None:
+        """Cancel every COV subscription of this client (coroutine)"""
+        for process_identifier in self._cov_subscriptions.values():
+            self.bacnet.cancel_cov(process_identifier)
+        self._cov_subscriptions.clear()
+        self._cov_expected.clear()
+        self.cov_cache.clear()
+    
+    def scan_object(self, object_type: str, instance: int) -> Dict[str, Any]:
+        """
+        Read every property of an object with one ReadPropertyMultiple request
+        
+        Uses the BACnet 'all' property identifier, so the device returns the
+        whole property set in a single transaction.
+        
+        Args:
+            object_type: Object type (e.g., 'analogValue', 'device')
+            instance: Instance number
+            
+        Returns:
+            Dictionary mapping property name (e.g. 'presentValue') to value;
+            properties the device failed to read are left out
+        """
+        try:
+            if not self.bacnet:
+                raise ConnectionError("Not connected to BACnet network")
+            
+            logger.info("Scanning %s:%s on %s", object_type, instance, self.device_address)
+            
+            properties = self._run_coroutine(self._async_scan_object(object_type, instance))
+            
+            logger.info("Read %s properties of %s:%s", len(properties), object_type, instance)
+            return properties
+            
+        except Exception as e:
+            logger.error("Failed to scan %s:%s: %s", object_type, instance, e)
+            raise
+    
+    async def _async_scan_object(self, object_type: str, instance: int) -> Dict[str, Any]:
+        """Read every property of an object (coroutine)"""
+        from bacpypes3.apdu import ErrorRejectAbortNack
+        from bacpypes3.basetypes import ErrorType
+        from BAC0.core.io.IOExceptions import (
+            NoResponseFromController, ReadPropertyMultipleException, SegmentationNotSupported
+        )
+        
+        object_identifier, property_identifier = self._identifier(object_type, instance, "all")
+        app = self.bacnet.this_application.app
+        
+        async def _scan_once():
+            try:
+                return await app.read_property_multiple(
+                    self._addr, [object_identifier, [property_identifier]]
+                )
+            except ErrorRejectAbortNack as err:
+                reason = str(err)
+                if "segmentation-not-supported" in reason:
+                    raise SegmentationNotSupported(reason)
+                if any(retryable in reason for retryable in RETRYABLE_ABORT_REASONS):
+                    raise NoResponseFromController(f"APDU Abort Reason : {reason}")
+                raise ReadPropertyMultipleException(f"APDU Abort Reason : {reason}")
+        
+        response = await self._retry(_scan_once, "Scan %s:%s", object_type, instance)
+        
+        return {
+            property_identifier.attr: value
+            for _, property_identifier, _, value in response
+            if not isinstance(value, ErrorType)
+        }
+    
+    def read_object_list(self) -> List[Tuple[str, int]]:
+        """
+        Read the object list of the device
+        
+        The list is paged with ReadRange requests of OBJECT_LIST_PAGE_SIZE
+        entries, avoiding the segmented response a single read of a large
+        objectList needs. Devices without ReadRange support are read one
+        array index at a time.
+        
+        Returns:
+            List of (object_type, instance) tuples
+        """
+        try:
+            if not self.bacnet:
+                raise ConnectionError("Not connected to BACnet network")
+            
+            logger.info("Reading object list of %s", self.device_address)
+            
+            # Large devices need many pages, allow extra time
+            objects = self._run_coroutine(self._async_read_object_list(), timeout=300)
+            
+            logger.info("Device %s has %s objects", self.device_id, len(objects))
+            return objects
+            
+        except Exception as e:
+            logger.error("Failed to read object list: %s", e)
+            raise
+    
+    async def _async_read_object_list(self) -> List[Tuple[str, int]]:
+        """Read the object list of the device (coroutine)"""
+        from bacpypes3.apdu import ErrorRejectAbortNack, ReadRangeRequest
+        from bacpypes3.basetypes import Range, RangeByPosition, ResultFlags
+        from bacpypes3.constructeddata import ArrayOf
+        from bacpypes3.primitivedata import ObjectIdentifier
+        from BAC0.core.io.IOExceptions import NoResponseFromController
+        
+        object_identifier, property_identifier = self._identifier("device", self.device_id, "objectList")
+        app = self.bacnet.this_application.app
+        
+        async def _read_page(index):
+            request = ReadRangeRequest(
+                objectIdentifier=object_identifier,
+                propertyIdentifier=property_identifier,
+                range=Range(byPosition=RangeByPosition(referenceIndex=index, count=OBJECT_LIST_PAGE_SIZE)),
+                destination=self._addr
+            )
+            try:
+                return await app.request(request)
+            except ErrorRejectAbortNack as err:
+                if any(retryable in str(err) for retryable in RETRYABLE_ABORT_REASONS):
+                    raise NoResponseFromController(f"APDU Abort Reason : {err}")
+                return err
+        
+        objects = []
+        index = 1
+        while True:
+            response = await self._retry(lambda: _read_page(index), "Read objectList from %s", index)
+            if isinstance(response, ErrorRejectAbortNack):
+                logger.warning("ReadRange failed (%s), reading objectList one entry at a time", response)
+                return await self._async_read_object_list_entries()
+            
+            page = response.itemData.cast_out(ArrayOf(ObjectIdentifier))
+            objects.extend((object_type.attr, instance) for object_type, instance in page)
+            index += len(page)
+            
+            if not page or not response.resultFlags[ResultFlags.moreItems]:
+                return objects
+    
+    async def _async_read_object_list_entries(self) -> List[Tuple[str, int]]:
+        """Read the object list one array index at a time"""
+        from bacpypes3.apdu import ErrorRejectAbortNack
+        from BAC0.core.io.IOExceptions import ReadPropertyException
+        
+        object_identifier, property_identifier = self._identifier("device", self.device_id, "objectList")
+        app = self.bacnet.this_application.app
+        semaphore = asyncio.Semaphore(DEFAULT_MAX_CONCURRENT_READS)
+        
+        async def _read_entry(index):
+            async with semaphore:
+                value = await self._retry(
+                    lambda: app.read_property(self._addr, object_identifier, property_identifier, index),
+                    "Read objectList[%s]", index
+                )
+            if isinstance(value, ErrorRejectAbortNack):
+                raise ReadPropertyException(f"APDU Abort Reason : {value}")
+            return value
+        
+        length = await _read_entry(0)
+        entries = await asyncio.gather(*[_read_entry(index) for index in range(1, length + 1)])
+        return [(object_type.attr, instance) for object_type, instance in entries]
+    
     def whois(self) -> list:
         """
         Perform Who-Is to discover devices on network
         
         Returns:
-            List of discovered devices
+            List of (address, device_id) tuples for the devices that answered
         """
         try:
             if not self.bacnet:
                 raise ConnectionError("Not connected to BACnet network")
             
-            logger.info("Performing Who-Is discovery...")
-            self.bacnet.whois()
+            logger.info("Performing Who-Is discovery (%s)...", self.discovery_mode)
             
-            # Wait for I-Am responses
-            time.sleep(3)
+            i_ams = self._run_coroutine(self._async_whois(), timeout=WHOIS_TIMEOUT + 1)
+            devices = [(str(i_am.pduSource), i_am.iAmDeviceIdentifier[1]) for i_am in i_ams]
             
-            devices = self.bacnet.devices
-            logger.info(f"Discovered {len(devices)} devices")
+            logger.info("Discovered %s devices", len(devices))
             
             return devices
             
         except Exception as e:
-            logger.error(f"Who-Is failed: {e}")
+            logger.error("Who-Is failed: %s", e)
             raise
     
+    async def _async_whois(self) -> list:
+        """
+        Send a Who-Is according to the discovery mode and collect I-Am responses
+        
+        Returns as soon as no new device has answered for WHOIS_SETTLE_TIME
+        seconds, or after WHOIS_TIMEOUT seconds at the latest.
+        """
+        from bacpypes3.apdu import WhoIsRequest
+        from bacpypes3.pdu import Address
+        from bacpypes3.service.device import WhoIsFuture
+        
+        app = self.bacnet.this_application.app
+        
+        if self.discovery_mode == "directed":
+            return await self._async_directed_whois(app)
+        
+        if self.discovery_mode == "multicast":
+            # bacpypes3 would only accept I-Am from the group address itself, so
+            # register a collector for any source and send the request manually
+            who_is = WhoIsFuture(app, None, None, None, WHOIS_TIMEOUT)
+            if not hasattr(app, "_who_is_futures"):
+                app._who_is_futures = []
+            app._who_is_futures.append(who_is)
+            app.request(WhoIsRequest(destination=Address(self.multicast_address)))
+            future = who_is.future
+        else:
+            future = app.who_is(timeout=WHOIS_TIMEOUT)
+            who_is = app._who_is_futures[-1]
+        
+        seen = 0
+        settled_at = self.loop.time() + WHOIS_SETTLE_TIME
+        while not future.done():
+            await asyncio.sleep(0.05)
+            if len(who_is.i_ams) != seen:
+                seen = len(who_is.i_ams)
+                settled_at = self.loop.time() + WHOIS_SETTLE_TIME
+            elif seen and self.loop.time() >= settled_at:
+                future.set_result(list(who_is.i_ams.values()))
+        
+        return future.result()
+    
+    async def _async_directed_whois(self, app) -> list:
+        """Unicast a Who-Is to every device address in the device cache"""
+        from bacpypes3.pdu import Address
+        
+        addresses = [
+            entry["address"] for entry in _load_json_cache(self.device_cache_file).values()
+            if "address" in entry
+        ]
+        if not addresses:
+            logger.warning("Directed discovery found no cached devices to query")
+            return []
+        
+        responses = await asyncio.gather(
+            *[app.who_is(address=Address(address), timeout=WHOIS_TIMEOUT) for address in addresses]
+        )
+        return [i_am for response in responses for i_am in response]
+    
     def get_device_info(self) -> Dict[str, Any]:
         """
         Get basic device information
@@ -279,41 +1625,51 @@ class EventLoopBACnetClient:
             if not self.bacnet:
                 raise ConnectionError("Not connected to BACnet network")
             
-            logger.info(f"Reading device information for {self.device_address}")
+            logger.info("Reading device information for %s", self.device_address)
             
-            device_request = f"{self.device_address} device {self.device_id}"
+            from BAC0.core.io.IOExceptions import APDUError, SegmentationNotSupported, UnrecognizedService
             
             info = {
                 "device_id": self.device_id,
                 "device_address": self.device_address,
             }
             
-            # Try to read common properties
-            try:
-                info["name"] = self.bacnet.read(f"{device_request} objectName")
-            except:
-                info["name"] = "Unknown"
+            requests = [
+                ("device", self.device_id, property_name)
+                for property_name in DEVICE_INFO_PROPERTIES.values()
+            ]
             
-            try:
-                info["vendor"] = self.bacnet.read(f"{device_request} vendorName")
-            except:
-                info["vendor"] = "Unknown"
+            values = [self._get_cached_property(*request) for request in requests]
+            missing = [request for request, value in zip(requests, values) if value is None]
             
-            try:
-                info["model"] = self.bacnet.read(f"{device_request} modelName")
-            except:
-                info["model"] = "Unknown"
+            # Read all uncached properties in a single ReadPropertyMultiple request
+            if missing:
+                try:
+                    read_values = self._read_multiple_chunk(missing)
+                except (SegmentationNotSupported, APDUError, UnrecognizedService) as e:
+                    logger.warning("ReadPropertyMultiple failed (%r), reading properties one by one", e)
+                    read_values = [self._read_device_property(property_name) for _, _, property_name in missing]
+                
+                for request, value in zip(missing, read_values):
+                    self._cache_property(*request, value)
+                
+                read_values = dict(zip(missing, read_values))
+                values = [
+                    value if value is not None else read_values.get(request)
+                    for request, value in zip(requests, values)
+                ]
             
-            try:
-                info["description"] = self.bacnet.read(f"{device_request} description")
-            except:
-                info["description"] = "Unknown"
+            for key, value in zip(DEVICE_INFO_PROPERTIES, values):
+                info[key] = value if value is not None else "Unknown"
+            
+            if missing:
+                self._run_coroutine(self._save_device_binding(info))
             
-            logger.info(f"Device info: {info}")
+            logger.info("Device info: %s", info)
             return info
             
         except Exception as e:
-            logger.error(f"Failed to get device info: {e}")
+            logger.error("Failed to get device info: %s", e)
             return {
                 "device_id": self.device_id,
                 "device_address": self.device_address,
@@ -323,6 +1679,15 @@ class EventLoopBACnetClient:
                 "description": "Unknown"
             }
     
+    def _read_device_property(self, property_name: str) -> Any:
+        """Read one device object property, returning None if it cannot be read"""
+        try:
+            return self._run_coroutine(
+                self.bacnet.read(self._request("device", self.device_id, property_name))
+            )
+        except Exception:
+            return None
+    
     def __enter__(self):
         """Context manager entry"""
         self.connect()
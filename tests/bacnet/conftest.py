@@ -4,18 +4,8 @@ Pytest configuration and shared fixtures for BACnet E2E tests
 import os
 import logging
 import pytest
-from dotenv import load_dotenv
-# from src.bacnet_client import BACnetClient
-from src.eventloop_bacnet_client import EventLoopBACnetClient as BACnetClient
 
-# Load environment variables
-load_dotenv()
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+logger = logging.getLogger(__name__)
 
 
 @pytest.fixture(scope="session")
@@ -31,6 +21,9 @@ def bacnet_config():
         "device_id": int(os.getenv("BACNET_DEVICE_ID", "0")),
         "device_port": int(os.getenv("BACNET_DEVICE_PORT", "47808")),
         "local_ip": os.getenv("BACNET_LOCAL_IP"),
+        # Each pytest-xdist worker (gw0, gw1, ...) binds its own UDP port
+        "local_port": int(os.getenv("BACNET_LOCAL_PORT", "47808"))
+            + int(os.getenv("PYTEST_XDIST_WORKER", "gw0")[2:]),
         "bbmd_address": os.getenv("BACNET_BBMD_ADDRESS", ""),
         "bbmd_ttl": int(os.getenv("BACNET_BBMD_TTL", "900")),
         "analog_value_instance": int(os.getenv("ANALOG_VALUE_INSTANCE", "1")),
@@ -39,6 +32,9 @@ def bacnet_config():
         "test_timeout": int(os.getenv("TEST_TIMEOUT", "30")),
         "retry_count": int(os.getenv("TEST_RETRY_COUNT", "3")),
         "retry_delay": int(os.getenv("TEST_RETRY_DELAY", "2")),
+        "poll_rate": int(os.getenv("BACNET_POLL_RATE", "0")),
+        "discovery_mode": os.getenv("BACNET_DISCOVERY_MODE", "broadcast"),
+        "multicast_address": os.getenv("BACNET_MULTICAST_ADDRESS", ""),
     }
     
     # Validate required configuration
@@ -55,52 +51,102 @@ def bacnet_config():
 
 
 @pytest.fixture(scope="session")
-def bacnet_client(bacnet_config):
+def bacnet_client(bacnet_config, request):
     """
     Create and connect a BACnet client for testing
     
     Yields:
         Connected BACnetClient instance
     """
+    # Imported here so test runs that do not use BACnet skip loading BAC0
+    # from src.bacnet_client import BACnetClient
+    from src.eventloop_bacnet_client import EventLoopBACnetClient as BACnetClient
+    
     client = BACnetClient(
         local_ip=bacnet_config["local_ip"],
+        local_port=bacnet_config["local_port"],
         device_ip=bacnet_config["device_ip"],
         device_id=bacnet_config["device_id"],
         bbmd_address=bacnet_config["bbmd_address"] if bacnet_config["bbmd_address"] else None,
-        bbmd_ttl=bacnet_config["bbmd_ttl"]
+        bbmd_ttl=bacnet_config["bbmd_ttl"],
+        poll_rate=bacnet_config["poll_rate"],
+        refresh_device_cache=request.config.getoption("--refresh-bacnet-cache"),
+        discovery_mode=bacnet_config["discovery_mode"],
+        multicast_address=bacnet_config["multicast_address"] or None,
+        retry_count=bacnet_config["retry_count"],
+        retry_delay=bacnet_config["retry_delay"]
     )
     
     # Connect to BACnet network
     client.connect()
     
+    # Serve the test AnalogValue from COV notifications instead of a read per call
+    client.subscribe_cov(bacnet_config["analog_value_instance"])
+    
     yield client
     
     # Cleanup: disconnect after test
     client.disconnect()
 
 
-@pytest.fixture(scope="function")
-def original_analog_value(bacnet_client, bacnet_config):
+@pytest.fixture(scope="session")
+def eventloop_client(bacnet_client):
+    """
+    Connected EventLoopBACnetClient shared by every test in the session
+    
+    Reuses the ``bacnet_client`` connection, so the whole session pays for
+    a single connect and device binding.
+    
+    Returns:
+        Connected EventLoopBACnetClient instance
+    """
+    return bacnet_client
+
+
+@pytest.fixture(scope="session")
+def analog_value_originals(bacnet_client):
+    """
+    Collect original AnalogValue values and restore them at session end
+    
+    All restorations are sent together with a single WritePropertyMultiple
+    request once every test has finished.
+    
+    Yields:
+        Dictionary mapping AnalogValue instance to its original value
     """
-    Read and store the original value of AnalogValue before test
+    originals = {}
     
-    This fixture ensures we can restore the original value after testing
+    yield originals
+    
+    # Cleanup: restore original values after all tests
+    if originals:
+        try:
+            bacnet_client.write_multiple(
+                [("analogValue", instance, value, 8) for instance, value in originals.items()]
+            )
+            logger.info("Restored original AnalogValues: %s", originals)
+        except Exception:
+            logger.exception("Failed to restore original values")
+
+
+@pytest.fixture(scope="module")
+def original_analog_value(bacnet_client, bacnet_config, analog_value_originals):
+    """
+    Read and store the original value of AnalogValue before the module's tests
+    
+    This fixture ensures we can restore the original value after testing;
+    the value is read once per module at most, and the value recorded
+    before the first test is restored at session end
     
     Returns:
         Original present value
     """
     instance = bacnet_config["analog_value_instance"]
-    original_value = bacnet_client.read_analog_value(instance)
-    logging.info(f"Stored original AnalogValue:{instance} = {original_value}")
-    
-    yield original_value
+    if instance not in analog_value_originals:
+        analog_value_originals[instance] = bacnet_client.read_analog_value(instance)
+        logger.info("Stored original AnalogValue:%s = %s", instance, analog_value_originals[instance])
     
-    # Cleanup: restore original value after test
-    try:
-        bacnet_client.write_analog_value(instance, original_value)
-        logging.info(f"Restored AnalogValue:{instance} to {original_value}")
-    except Exception as e:
-        logging.error(f"Failed to restore original value: {e}")
+    return analog_value_originals[instance]
 
 
 def pytest_configure(config):
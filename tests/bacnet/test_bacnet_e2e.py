@@ -4,14 +4,16 @@ End-to-End Tests for BACnet Device Interaction
 Tests reading, writing, and verification of AnalogValue objects
 """
 import time
+import random
 import logging
+from math import isclose
 import pytest
-from src.bacnet_client import BACnetClient
 
 logger = logging.getLogger(__name__)
 
 
 @pytest.mark.e2e
+@pytest.mark.xdist_group("analog_value_writes")
 @pytest.mark.timeout(60)
 class TestBACnetAnalogValueE2E:
     """End-to-end tests for BACnet AnalogValue operations"""
@@ -33,10 +35,10 @@ class TestBACnetAnalogValueE2E:
         assert device_info["device_id"] == bacnet_config["device_id"], \
             f"Device ID mismatch: expected {bacnet_config['device_id']}, got {device_info['device_id']}"
         
-        logger.info(f"✓ Connected to device: {device_info['name']}")
-        logger.info(f"  - Device ID: {device_info['device_id']}")
-        logger.info(f"  - Vendor: {device_info['vendor']}")
-        logger.info(f"  - Model: {device_info['model']}")
+        logger.info("✓ Connected to device: %s", device_info['name'])
+        logger.info("  - Device ID: %s", device_info['device_id'])
+        logger.info("  - Vendor: %s", device_info['vendor'])
+        logger.info("  - Model: %s", device_info['model'])
     
     def test_read_analog_value_present_value(self, bacnet_client, bacnet_config):
         """
@@ -57,7 +59,64 @@ class TestBACnetAnalogValueE2E:
         assert isinstance(value, (int, float)), \
             f"Expected numeric value, got {type(value)}"
         
-        logger.info(f"✓ Successfully read AnalogValue:{instance} = {value}")
+        logger.info("✓ Successfully read AnalogValue:%s = %s", instance, value)
+    
+    def test_read_multiple_properties(self, bacnet_client, bacnet_config):
+        """
+        Test: Read several properties with one ReadPropertyMultiple request
+        
+        Steps:
+        1. Read presentValue of the AnalogValue and device properties together
+        2. Verify one readable value is returned per requested property
+        3. Verify presentValue is numeric
+        """
+        from bacpypes3.basetypes import ErrorType
+        
+        instance = bacnet_config["analog_value_instance"]
+        device_id = bacnet_config["device_id"]
+        requests = [
+            ("analogValue", instance, "presentValue"),
+            ("device", device_id, "objectName"),
+            ("device", device_id, "vendorName"),
+        ]
+        
+        values = bacnet_client.read_multiple(requests)
+        
+        # Assertions
+        assert len(values) == len(requests), \
+            f"Expected {len(requests)} values, got {len(values)}"
+        for request, value in zip(requests, values):
+            assert value is not None and not isinstance(value, ErrorType), \
+                f"Failed to read {request}: got {value!r}"
+        assert isinstance(values[0], (int, float)), \
+            f"Expected numeric presentValue, got {values[0]!r}"
+        
+        logger.info("✓ Successfully read %s properties: %s", len(values), values)
+    
+    def test_write_multiple_values(
+        self,
+        bacnet_client,
+        bacnet_config,
+        original_analog_value
+    ):
+        """
+        Test: Write presentValue with one WritePropertyMultiple request
+        
+        Steps:
+        1. Write test value to AnalogValue via write_multiple
+        2. Read back and verify the value
+        """
+        instance = bacnet_config["analog_value_instance"]
+        test_value = bacnet_config["test_write_value"]
+        
+        bacnet_client.write_multiple([("analogValue", instance, test_value, 8)])
+        read_value = bacnet_client.read_analog_value(instance)
+        
+        # Allow small floating point tolerance
+        assert isclose(read_value, test_value, abs_tol=0.01), \
+            f"Value mismatch: wrote {test_value}, read back {read_value}"
+        
+        logger.info("✓ Successfully wrote %s with WritePropertyMultiple", test_value)
     
     def test_write_analog_value_present_value(
         self,
@@ -79,8 +138,8 @@ class TestBACnetAnalogValueE2E:
         # Write test value
         bacnet_client.write_analog_value(instance, test_value)
         
-        logger.info(f"✓ Successfully wrote {test_value} to AnalogValue:{instance}")
-        logger.info(f"  (Original value {original_analog_value} will be restored)")
+        logger.info("✓ Successfully wrote %s to AnalogValue:%s", test_value, instance)
+        logger.info("  (Original value %s will be restored)", original_analog_value)
     
     def test_write_and_read_back_verify(
         self,
@@ -102,36 +161,38 @@ class TestBACnetAnalogValueE2E:
         instance = bacnet_config["analog_value_instance"]
         test_value = bacnet_config["test_write_value"]
         
-        logger.info(f"Starting E2E test for AnalogValue:{instance}")
-        logger.info(f"Original value: {original_analog_value}")
+        logger.info("Starting E2E test for AnalogValue:%s", instance)
+        logger.info("Original value: %s", original_analog_value)
         
         # Step 1: Write new value
-        logger.info(f"Step 1: Writing test value {test_value}...")
+        logger.info("Step 1: Writing test value %s...", test_value)
+        cov_event = bacnet_client.cov_events[instance]
+        cov_event.clear()
         bacnet_client.write_analog_value(instance, test_value)
         
-        # Step 2: Wait for value to propagate (adjust delay as needed)
+        # Step 2: Wait for the COV notification of the new value, at most the propagation delay
         propagation_delay = 2
-        logger.info(f"Step 2: Waiting {propagation_delay}s for value to propagate...")
-        time.sleep(propagation_delay)
+        logger.info("Step 2: Waiting up to %ss for value to propagate...", propagation_delay)
+        if not cov_event.wait(timeout=propagation_delay):
+            logger.info("  No COV notification within %ss; relying on read-back", propagation_delay)
         
         # Step 3: Read back value
-        logger.info(f"Step 3: Reading back value...")
+        logger.info("Step 3: Reading back value...")
         read_value = bacnet_client.read_analog_value(instance)
         
         # Step 4: Verify
-        logger.info(f"Step 4: Verifying written value matches read value...")
-        logger.info(f"  - Written value: {test_value}")
-        logger.info(f"  - Read value: {read_value}")
+        logger.info("Step 4: Verifying written value matches read value...")
+        logger.info("  - Written value: %s", test_value)
+        logger.info("  - Read value: %s", read_value)
         
         # Allow small floating point tolerance
-        tolerance = 0.01
-        assert abs(read_value - test_value) < tolerance, \
+        assert isclose(read_value, test_value, abs_tol=0.01), \
             f"Value mismatch: wrote {test_value}, read back {read_value}"
         
-        logger.info(f"✓ E2E Test PASSED: Write-Read-Verify cycle successful!")
-        logger.info(f"  - Original: {original_analog_value}")
-        logger.info(f"  - Written: {test_value}")
-        logger.info(f"  - Verified: {read_value}")
+        logger.info("✓ E2E Test PASSED: Write-Read-Verify cycle successful!")
+        logger.info("  - Original: %s", original_analog_value)
+        logger.info("  - Written: %s", test_value)
+        logger.info("  - Verified: %s", read_value)
     
     def test_multiple_write_read_cycles(
         self,
@@ -140,94 +201,101 @@ class TestBACnetAnalogValueE2E:
         original_analog_value
     ):
         """
-        Test: Perform multiple write-read-verify cycles
+        Test: Perform multiple pipelined writes and verify the final value
         
         Steps:
-        1. Write multiple different values
-        2. Verify each write by reading back
-        3. Ensure consistency across cycles
+        1. Send every value but the last without waiting for each acknowledgement
+        2. Wait for all of those writes to be acknowledged
+        3. Write the last value and read it back to verify
         """
         instance = bacnet_config["analog_value_instance"]
         test_values = [10.0, 25.5, 50.0, 75.5, 100.0]
         
-        logger.info(f"Testing multiple write-read cycles with values: {test_values}")
+        logger.info("Testing multiple write-read cycles with values: %s", test_values)
         
-        for i, test_value in enumerate(test_values, 1):
-            logger.info(f"Cycle {i}/{len(test_values)}: Testing value {test_value}")
-            
-            # Write
-            bacnet_client.write_analog_value(instance, test_value)
-            
-            # Short delay
-            time.sleep(1)
-            
-            # Read back
-            read_value = bacnet_client.read_analog_value(instance)
-            
-            # Verify
-            tolerance = 0.01
-            assert abs(read_value - test_value) < tolerance, \
-                f"Cycle {i} failed: wrote {test_value}, read {read_value}"
-            
-            logger.info(f"  ✓ Cycle {i} passed: {test_value} → {read_value}")
+        # Pipeline the writes instead of one round trip each
+        pending = [
+            bacnet_client.write_analog_value_nowait(instance, test_value)
+            for test_value in test_values[:-1]
+        ]
+        for i, write in enumerate(pending, 1):
+            write.result(timeout=bacnet_client.operation_timeout)
+            logger.info("  ✓ Write %s/%s acknowledged", i, len(test_values))
+        
+        # The last write is sent after every earlier one was applied, so it wins
+        final_value = test_values[-1]
+        bacnet_client.write_analog_value(instance, final_value)
+        read_value = bacnet_client.read_analog_value(instance)
         
-        logger.info(f"✓ All {len(test_values)} write-read cycles completed successfully!")
+        # Verify
+        assert isclose(read_value, final_value, abs_tol=0.01), \
+            f"Final write failed: wrote {final_value}, read {read_value}"
+        
+        logger.info("✓ All %s writes completed, read back %s", len(test_values), read_value)
     
-    @pytest.mark.parametrize("test_value", [0.0, 25.0, 50.0, 75.0, 100.0])
-    def test_write_read_parametrized(
+    def test_write_read_values(
         self,
         bacnet_client,
         bacnet_config,
-        original_analog_value,
-        test_value
+        original_analog_value
     ):
         """
-        Test: Parametrized test for different values
+        Test: Write and read back a vector of values in one test
         
-        This test will run 5 times with different values
+        Each value is written and read back in turn, then all read values are
+        verified together. Writes are acknowledged by the device before the
+        read, so no propagation delay is needed between them.
         """
         instance = bacnet_config["analog_value_instance"]
+        test_values = [0.0, 25.0, 50.0, 75.0, 100.0]
         
-        # Write
-        bacnet_client.write_analog_value(instance, test_value)
-        time.sleep(1)
-        
-        # Read back
-        read_value = bacnet_client.read_analog_value(instance)
+        read_values = []
+        for test_value in test_values:
+            bacnet_client.write_analog_value(instance, test_value)
+            read_values.append(bacnet_client.read_analog_value(instance))
         
         # Verify
-        tolerance = 0.01
-        assert abs(read_value - test_value) < tolerance, \
-            f"Value mismatch: wrote {test_value}, read {read_value}"
-        
-        logger.info(f"✓ Parametrized test passed for value {test_value}")
+        mismatches = [
+            (test_value, read_value)
+            for test_value, read_value in zip(test_values, read_values)
+            if not isclose(read_value, test_value, abs_tol=0.01)
+        ]
+        assert not mismatches, \
+            f"Value mismatch (written, read): {mismatches}"
+        
+        logger.info("✓ Write-read passed for values %s", test_values)
     
     def test_read_analog_value_with_retry(self, bacnet_client, bacnet_config):
         """
         Test: Read with retry logic for robustness
         
-        Demonstrates retry pattern for flaky network conditions
+        Demonstrates retry pattern for flaky network conditions: exponential
+        backoff with jitter between attempts, bounded by an overall deadline
         """
         instance = bacnet_config["analog_value_instance"]
         max_retries = bacnet_config["retry_count"]
         retry_delay = bacnet_config["retry_delay"]
+        deadline = time.monotonic() + 5.0
         
         for attempt in range(1, max_retries + 1):
             try:
-                logger.info(f"Read attempt {attempt}/{max_retries}")
+                logger.info("Read attempt %s/%s", attempt, max_retries)
                 value = bacnet_client.read_analog_value(instance)
                 
-                logger.info(f"✓ Successfully read on attempt {attempt}: {value}")
+                logger.info("✓ Successfully read on attempt %s: %s", attempt, value)
                 assert value is not None
                 return  # Success - exit test
                 
             except Exception as e:
-                logger.warning(f"Attempt {attempt} failed: {e}")
+                logger.warning("Attempt %s failed: %s", attempt, e)
                 
-                if attempt == max_retries:
-                    pytest.fail(f"Failed to read after {max_retries} attempts")
+                remaining = deadline - time.monotonic()
+                if attempt == max_retries or remaining <= 0:
+                    pytest.fail(f"Failed to read after {attempt} attempts")
                 
-                time.sleep(retry_delay)
+                # Back off exponentially with jitter, never past the deadline
+                backoff = min(retry_delay * 2 ** (attempt - 1), 4.0) * random.uniform(0.5, 1.5)
+                time.sleep(min(backoff, remaining))
 
 
 @pytest.mark.e2e
@@ -250,17 +318,17 @@ class TestBACnetAnalogValueProperties:
                 "units"
             )
             
-            logger.info(f"✓ AnalogValue:{instance} units: {units}")
+            logger.info("✓ AnalogValue:%s units: %s", instance, units)
             
             # Optional: verify expected units if configured
             expected_units = bacnet_config.get("expected_units")
             if expected_units:
                 assert str(units).lower() == expected_units.lower(), \
                     f"Units mismatch: expected {expected_units}, got {units}"
-                logger.info(f"  ✓ Units match expected: {expected_units}")
+                logger.info("  ✓ Units match expected: %s", expected_units)
             
         except Exception as e:
-            logger.warning(f"Could not read units property: {e}")
+            logger.warning("Could not read units property: %s", e)
             pytest.skip("Units property not available or readable")
     
     def test_read_analog_value_description(self, bacnet_client, bacnet_config):
@@ -276,15 +344,29 @@ class TestBACnetAnalogValueProperties:
                 "description"
             )
             
-            logger.info(f"✓ AnalogValue:{instance} description: {description}")
+            logger.info("✓ AnalogValue:%s description: %s", instance, description)
             assert description is not None
             
         except Exception as e:
-            logger.warning(f"Could not read description property: {e}")
+            logger.warning("Could not read description property: %s", e)
             pytest.skip("Description property not available or readable")
+    
+    def test_scan_analog_value(self, bacnet_client, bacnet_config):
+        """
+        Test: Read all properties of the AnalogValue in one request
+        """
+        instance = bacnet_config["analog_value_instance"]
+        
+        properties = bacnet_client.scan_object("analogValue", instance)
+        
+        assert "presentValue" in properties, \
+            f"presentValue missing from scanned properties: {sorted(properties)}"
+        
+        logger.info("✓ AnalogValue:%s has %s properties", instance, len(properties))
 
 
 @pytest.mark.e2e
+@pytest.mark.xdist_group("analog_value_writes")
 class TestBACnetErrorHandling:
     """Tests for error handling and edge cases"""
     
@@ -299,7 +381,7 @@ class TestBACnetErrorHandling:
         with pytest.raises(Exception) as exc_info:
             bacnet_client.read_analog_value(invalid_instance)
         
-        logger.info(f"✓ Correctly raised exception for invalid instance: {exc_info.value}")
+        logger.info("✓ Correctly raised exception for invalid instance: %s", exc_info.value)
     
     def test_write_invalid_value_type(self, bacnet_client, bacnet_config):
         """
@@ -315,4 +397,4 @@ class TestBACnetErrorHandling:
             bacnet_client.write_analog_value(instance, "invalid")
             pytest.fail("Should have raised an error for invalid value type")
         except (ValueError, TypeError) as e:
-            logger.info(f"✓ Correctly rejected invalid value type: {e}")
\ No newline at end of file
+            logger.info("✓ Correctly rejected invalid value type: %s", e)
\ No newline at end of file
@@ -0,0 +1,43 @@
+"""
+Pytest configuration shared by all test suites
+"""
+import os
+import logging
+import pytest
+from dotenv import load_dotenv
+
+# Load environment variables once, before any test module reads them
+load_dotenv()
+
+
+def pytest_addoption(parser):
+    """Add custom command line options"""
+    parser.addoption(
+        "--refresh-bacnet-cache",
+        action="store_true",
+        default=False,
+        help="Ignore cached BACnet device bindings and rediscover devices"
+    )
+    parser.addoption(
+        "--run-broken",
+        action="store_true",
+        default=False,
+        help="Run tests that exercise known-broken client implementations"
+    )
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _configure_logging():
+    """
+    Configure logging once for the test session
+    
+    Logs at WARNING unless BACNET_LOG_LEVEL asks for more. Only the root
+    level is set; pytest's own handlers capture and format the records.
+    """
+    root = logging.getLogger()
+    level = root.level
+    root.setLevel(os.getenv("BACNET_LOG_LEVEL", "WARNING").upper())
+    
+    yield
+    
+    root.setLevel(level)
@@ -1,75 +1,76 @@
 """
 Test cases for calculator module
 """
+from types import ModuleType
 import pytest
-from src.calculator import add, subtract, multiply, divide, is_even
+from hypothesis import example, given, settings
+from hypothesis import strategies as st
+
+# Bounded operands keep every property test to a single, fast pytest item
+operands = st.integers(min_value=-1000, max_value=1000)
+nonzero_operands = operands.filter(lambda n: n != 0)
+bounded = settings(max_examples=50, deadline=None)
+
+
+@pytest.fixture(scope="module")
+def calculator() -> ModuleType:
+    """Import the calculator module on first use, not at collection"""
+    import src.calculator
+    return src.calculator
 
 
 class TestCalculator:
     """Test calculator functions"""
     
-    def test_add_positive_numbers(self):
-        """Test addition of positive numbers"""
-        assert add(2, 3) == 5
-        assert add(10, 5) == 15
-    
-    def test_add_negative_numbers(self):
-        """Test addition with negative numbers"""
-        assert add(-2, -3) == -5
-        assert add(-10, 5) == -5
+    @bounded
+    @given(a=operands, b=operands)
+    @example(a=2, b=3)
+    @example(a=-2, b=-3)
+    @example(a=-10, b=5)
+    @example(a=100, b=200)
+    @example(a=-1, b=1)
+    def test_add(self, calculator, a, b):
+        """Test addition of positive and negative numbers"""
+        assert calculator.add(a, b) == a + b
     
-    def test_subtract(self):
+    @bounded
+    @given(a=operands, b=operands)
+    @example(a=10, b=5)
+    @example(a=5, b=10)
+    @example(a=0, b=5)
+    def test_subtract(self, calculator, a, b):
         """Test subtraction"""
-        assert subtract(10, 5) == 5
-        assert subtract(5, 10) == -5
-        assert subtract(0, 5) == -5
+        assert calculator.subtract(a, b) == a - b
     
-    def test_multiply(self):
+    @bounded
+    @given(a=operands, b=operands)
+    @example(a=3, b=4)
+    @example(a=-2, b=5)
+    @example(a=0, b=100)
+    def test_multiply(self, calculator, a, b):
         """Test multiplication"""
-        assert multiply(3, 4) == 12
-        assert multiply(-2, 5) == -10
-        assert multiply(0, 100) == 0
+        assert calculator.multiply(a, b) == a * b
     
-    def test_divide(self):
+    @bounded
+    @given(a=operands, b=nonzero_operands)
+    @example(a=10, b=2)
+    @example(a=9, b=3)
+    @example(a=7, b=2)
+    def test_divide(self, calculator, a, b):
         """Test division"""
-        assert divide(10, 2) == 5
-        assert divide(9, 3) == 3
-        assert divide(7, 2) == 3.5
+        assert calculator.divide(a, b) == a / b
     
-    def test_divide_by_zero(self):
+    def test_divide_by_zero(self, calculator):
         """Test division by zero raises ValueError"""
         with pytest.raises(ValueError, match="Cannot divide by zero"):
-            divide(10, 0)
+            calculator.divide(10, 0)
     
-    def test_is_even(self):
+    @bounded
+    @given(n=operands)
+    @example(n=0)
+    @example(n=-1)
+    @example(n=49)
+    def test_is_even(self, calculator, n):
         """Test even number detection"""
-        assert is_even(2) is True
-        assert is_even(4) is True
-        assert is_even(0) is True
-        assert is_even(3) is False
-        assert is_even(7) is False
-        assert is_even(-2) is True
-
-
-@pytest.mark.parametrize("a,b,expected", [
-    (1, 1, 2),
-    (5, 5, 10),
-    (100, 200, 300),
-    (-1, 1, 0),
-])
-def test_add_parametrized(a, b, expected):
-    """Parametrized test for add function"""
-    assert add(a, b) == expected
-
-
-@pytest.mark.parametrize("n,expected", [
-    (0, True),
-    (2, True),
-    (4, True),
-    (1, False),
-    (3, False),
-    (99, False),
-])
-def test_is_even_parametrized(n, expected):
-    """Parametrized test for is_even function"""
-    assert is_even(n) == expected
\ No newline at end of file
+        assert calculator.is_even(2 * n) is True
+        assert calculator.is_even(2 * n + 1) is False
@@ -0,0 +1,46 @@
+"""
+Unit tests for the shared BACnet event loop and stack pool
+"""
+import asyncio
+import pytest
+from src.bacnet_runtime import acquire_stack, close_stacks, get_loop, release_stack
+
+pytestmark = pytest.mark.unit
+
+
+class FakeStack:
+    """BAC0 stack stub whose disconnect() schedules a task like BAC0 does"""
+    
+    def __init__(self):
+        self.closed = False
+    
+    def disconnect(self):
+        return asyncio.create_task(self._disconnect())
+    
+    async def _disconnect(self):
+        self.closed = True
+
+
+class TestStackPool:
+    """Pooling and closing BACnet stacks"""
+    
+    def test_acquire_returns_released_stack(self):
+        """Test a released stack is handed to the next client with the same key"""
+        get_loop()
+        stack = FakeStack()
+        
+        assert release_stack(("pool-test",), stack)
+        assert not release_stack(("pool-test",), FakeStack())
+        assert acquire_stack(("pool-test",)) is stack
+        assert acquire_stack(("pool-test",)) is None
+    
+    def test_close_stacks_disconnects_pooled_stacks(self):
+        """Test close_stacks() disconnects every pooled stack on the event loop"""
+        get_loop()
+        stack = FakeStack()
+        release_stack(("close-test",), stack)
+        
+        close_stacks()
+        
+        assert stack.closed
+        assert acquire_stack(("close-test",)) is None
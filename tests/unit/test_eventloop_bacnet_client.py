@@ -0,0 +1,519 @@
+"""
+Unit tests for EventLoopBACnetClient against a stubbed BACnet stack
+
+No device or network is needed: the bacpypes3 application is replaced by
+a fake that answers from memory.
+"""
+import asyncio
+import json
+import os
+from types import SimpleNamespace
+import pytest
+from bacpypes3.apdu import AbortPDU, RejectPDU, SimpleAckPDU
+from bacpypes3.basetypes import ErrorType
+from bacpypes3.primitivedata import PropertyIdentifier
+from bacpypes3.vendor import get_vendor_info
+from BAC0.core.io.IOExceptions import NoResponseFromController, WritePropertyException
+import src.eventloop_bacnet_client as eventloop_bacnet_client
+from src.eventloop_bacnet_client import CAP_PROBE_INTERVAL, EventLoopBACnetClient, _save_json_cache
+
+pytestmark = pytest.mark.unit
+
+DEVICE_ADDRESS = "192.168.1.150:1234"
+
+
+class FakeDeviceInfoCache:
+    """bacpypes3 device info cache stub holding at most one device"""
+    
+    def __init__(self, device_info=None):
+        self.device_info = device_info
+    
+    async def get_device_info(self, device_identifier):
+        return self.device_info
+
+
+class FakeApp:
+    """
+    bacpypes3 application stub answering every property with its object's
+    instance number, or with an ErrorType for properties listed in ``errors``
+    """
+    
+    def __init__(self, max_properties=None, abort=None, errors=()):
+        self.max_properties = max_properties
+        self.abort = abort
+        self.errors = set(errors)
+        self.request_sizes = []
+        self.single_reads = 0
+        self.writes = []
+        self.write_multiple_requests = 0
+        self.device_info_cache = FakeDeviceInfoCache()
+    
+    async def read_property_multiple(self, address, parameter_list):
+        properties = [
+            (object_identifier, property_identifier)
+            for object_identifier, property_identifiers in zip(parameter_list[::2], parameter_list[1::2])
+            for property_identifier in property_identifiers
+        ]
+        self.request_sizes.append(len(properties))
+        
+        if self.abort:
+            raise AbortPDU(reason=self.abort)
+        if self.max_properties is not None and len(properties) > self.max_properties:
+            raise AbortPDU(reason="apdu-too-long")
+        
+        return [
+            (object_identifier, property_identifier, None, self._value(object_identifier, property_identifier))
+            for object_identifier, property_identifier in properties
+        ]
+    
+    async def read_property(self, address, object_identifier, property_identifier):
+        self.single_reads += 1
+        if self.abort:
+            raise AbortPDU(reason=self.abort)
+        return self._value(object_identifier, property_identifier)
+    
+    async def write_property(self, address, object_identifier, property_identifier, value, array_index, priority):
+        self.writes.append(value)
+    
+    async def get_vendor_info(self, device_address=None):
+        return get_vendor_info(0)
+    
+    async def request(self, apdu):
+        self.write_multiple_requests += 1
+        if self.abort:
+            raise AbortPDU(reason=self.abort)
+        return SimpleAckPDU()
+    
+    def _value(self, object_identifier, property_identifier):
+        """Value the fake device holds for a property"""
+        if property_identifier.attr in self.errors:
+            return ErrorType(errorClass="property", errorCode="unknown-property")
+        return float(object_identifier[1])
+
+
+class NoReadMultipleApp(FakeApp):
+    """bacpypes3 application stub rejecting ReadPropertyMultiple"""
+    
+    async def read_property_multiple(self, address, parameter_list):
+        self.request_sizes.append(sum(len(property_identifiers) for property_identifiers in parameter_list[1::2]))
+        raise RejectPDU(reason="unrecognized-service")
+
+
+def make_client(caps_cache_file, app, device_cache_file=None, retry_count=3, retry_delay=0):
+    """Create a client wired to a fake application instead of a BACnet stack"""
+    client = EventLoopBACnetClient(
+        local_ip="127.0.0.1",
+        device_ip="192.168.1.150",
+        device_id=1234,
+        points_per_request=8,
+        caps_cache_file=str(caps_cache_file),
+        device_cache_file=str(device_cache_file) if device_cache_file else None,
+        retry_count=retry_count,
+        retry_delay=retry_delay
+    )
+    client.bacnet = SimpleNamespace(this_application=SimpleNamespace(app=app))
+    client._addr = DEVICE_ADDRESS
+    return client
+
+
+def present_values(count):
+    """Requests for presentValue of AnalogValue 0..count-1"""
+    return [("analogValue", instance, "presentValue") for instance in range(count)]
+
+
+class TestReadMultipleChunkSizing:
+    """Learning, probing and persisting the ReadPropertyMultiple chunk size"""
+    
+    def test_halves_cap_when_request_too_large(self, tmp_path):
+        """Test chunk size is halved until the device accepts it, and persisted"""
+        caps_file = tmp_path / "caps.json"
+        app = FakeApp(max_properties=3)
+        client = make_client(caps_file, app)
+        
+        values = client.read_multiple(present_values(8))
+        
+        assert values == [float(instance) for instance in range(8)]
+        assert app.request_sizes[:3] == [8, 4, 2]
+        assert json.loads(caps_file.read_text()) == {DEVICE_ADDRESS: 2}
+    
+    def test_keeps_cap_on_timeout(self, tmp_path):
+        """Test a timed out request raises without shrinking the chunk size"""
+        caps_file = tmp_path / "caps.json"
+        app = FakeApp(abort="no-response")
+        client = make_client(caps_file, app)
+        
+        with pytest.raises(NoResponseFromController):
+            client.read_multiple(present_values(8))
+        
+        assert app.request_sizes == [8] * client.retry_count
+        assert DEVICE_ADDRESS not in client._max_points_per_request
+        assert not caps_file.exists()
+    
+    def test_probes_larger_cap(self, tmp_path):
+        """Test a chunk one property larger is tried after enough successes"""
+        caps_file = tmp_path / "caps.json"
+        caps_file.write_text(json.dumps({DEVICE_ADDRESS: 2}))
+        app = FakeApp(max_properties=3)
+        client = make_client(caps_file, app)
+        client._cap_successes[DEVICE_ADDRESS] = CAP_PROBE_INTERVAL
+        
+        values = client.read_multiple(present_values(6))
+        
+        assert values == [float(instance) for instance in range(6)]
+        assert app.request_sizes == [3, 3]
+        assert json.loads(caps_file.read_text()) == {DEVICE_ADDRESS: 3}
+    
+    def test_failed_probe_keeps_cap(self, tmp_path):
+        """Test a rejected probe falls back to the known good chunk size"""
+        caps_file = tmp_path / "caps.json"
+        caps_file.write_text(json.dumps({DEVICE_ADDRESS: 2}))
+        app = FakeApp(max_properties=2)
+        client = make_client(caps_file, app)
+        client._cap_successes[DEVICE_ADDRESS] = CAP_PROBE_INTERVAL
+        
+        values = client.read_multiple(present_values(4))
+        
+        assert values == [float(instance) for instance in range(4)]
+        assert app.request_sizes == [3, 2, 2]
+        assert json.loads(caps_file.read_text()) == {DEVICE_ADDRESS: 2}
+    
+    def test_loads_learned_cap(self, tmp_path):
+        """Test a new client starts from the chunk size learned by an earlier one"""
+        caps_file = tmp_path / "caps.json"
+        make_client(caps_file, FakeApp(max_properties=3)).read_multiple(present_values(8))
+        
+        app = FakeApp(max_properties=3)
+        make_client(caps_file, app).read_multiple(present_values(4))
+        
+        assert app.request_sizes == [2, 2]
+
+
+class TestReadMultipleErrors:
+    """Per-property errors in ReadPropertyMultiple responses"""
+    
+    def test_error_property_returned_as_none(self, tmp_path):
+        """Test an ErrorType in the response is returned as None, not as a value"""
+        client = make_client(tmp_path / "caps.json", FakeApp(errors={"description"}))
+        
+        values = client.read_multiple([
+            ("analogValue", 1, "presentValue"),
+            ("analogValue", 1, "description"),
+            ("analogValue", 2, "presentValue"),
+        ])
+        
+        assert values == [1.0, None, 2.0]
+    
+    def test_error_property_not_cached(self, tmp_path):
+        """Test get_device_info reports an unreadable property as Unknown and reads it again next time"""
+        app = FakeApp(errors={"description"})
+        client = make_client(tmp_path / "caps.json", app)
+        
+        info = client.get_device_info()
+        assert info["description"] == "Unknown"
+        assert info["name"] == 1234.0
+        
+        client.get_device_info()
+        assert app.request_sizes == [4, 1]
+    
+    def test_falls_back_to_single_reads(self, tmp_path):
+        """Test a device without ReadPropertyMultiple is read property by property"""
+        app = NoReadMultipleApp()
+        client = make_client(tmp_path / "caps.json", app)
+        
+        values = client.read_multiple(present_values(4))
+        
+        assert values == [0.0, 1.0, 2.0, 3.0]
+        assert app.request_sizes == [4]
+        assert app.single_reads == 4
+
+
+class TestDeviceCache:
+    """Persisting caches and device bindings"""
+    
+    DEVICE_INFO = SimpleNamespace(
+        device_address="192.168.1.150",
+        max_apdu_length_accepted=1476,
+        segmentation_supported="segmented-both",
+        vendor_identifier=15
+    )
+    
+    def test_save_json_cache_replaces_file(self, tmp_path):
+        """Test the cache file is replaced whole and no temporary file is left behind"""
+        path = tmp_path / "cache" / "devices.json"
+        _save_json_cache(str(path), {"old": 1})
+        _save_json_cache(str(path), {"new": 2})
+        
+        assert json.loads(path.read_text()) == {"new": 2}
+        assert os.listdir(path.parent) == ["devices.json"]
+    
+    def test_saves_complete_binding(self, tmp_path):
+        """Test a binding with fully read device info is persisted"""
+        device_file = tmp_path / "devices.json"
+        app = FakeApp()
+        app.device_info_cache = FakeDeviceInfoCache(self.DEVICE_INFO)
+        client = make_client(tmp_path / "caps.json", app, device_cache_file=device_file)
+        
+        client.get_device_info()
+        
+        entry = json.loads(device_file.read_text())[DEVICE_ADDRESS]
+        assert entry["address"] == "192.168.1.150"
+        assert entry["description"] == "1234.0"
+    
+    def test_skips_incomplete_binding(self, tmp_path):
+        """Test a binding is not persisted when a device property failed to read"""
+        device_file = tmp_path / "devices.json"
+        app = FakeApp(errors={"description"})
+        app.device_info_cache = FakeDeviceInfoCache(self.DEVICE_INFO)
+        client = make_client(tmp_path / "caps.json", app, device_cache_file=device_file)
+        
+        client.get_device_info()
+        
+        assert not device_file.exists()
+    
+    def test_drops_invalid_binding(self, tmp_path):
+        """Test a cached binding missing fields is dropped instead of failing the connection"""
+        device_file = tmp_path / "devices.json"
+        device_file.write_text(json.dumps({
+            DEVICE_ADDRESS: {"device_id": 1234, "address": "192.168.1.150"},
+            "192.168.1.151": {"device_id": 1235},
+        }))
+        app = FakeApp()
+        client = make_client(tmp_path / "caps.json", app, device_cache_file=device_file)
+        
+        client._run_coroutine(client._bind_cached_device())
+        
+        assert app.device_info_cache.device_info is None
+        assert json.loads(device_file.read_text()) == {"192.168.1.151": {"device_id": 1235}}
+
+
+class TestWriteMultiple:
+    """Classifying WritePropertyMultiple errors"""
+    
+    WRITES = [("analogValue", 1, 20.0, None), ("analogValue", 2, 30.0, 8)]
+    
+    def test_sends_one_request(self, tmp_path):
+        """Test a chunk of writes goes out as a single request"""
+        app = FakeApp()
+        client = make_client(tmp_path / "caps.json", app)
+        
+        client.write_multiple(self.WRITES)
+        
+        assert app.write_multiple_requests == 1
+    
+    def test_retries_timeouts(self, tmp_path):
+        """Test a timed out request is retried and then raised as a timeout"""
+        app = FakeApp(abort="no-response")
+        client = make_client(tmp_path / "caps.json", app)
+        
+        with pytest.raises(NoResponseFromController):
+            client.write_multiple(self.WRITES)
+        
+        assert app.write_multiple_requests == client.retry_count
+    
+    def test_raises_other_errors_as_write_errors(self, tmp_path):
+        """Test a rejected write is raised as a write error without retrying"""
+        app = FakeApp(abort="other")
+        client = make_client(tmp_path / "caps.json", app)
+        
+        with pytest.raises(WritePropertyException):
+            client.write_multiple(self.WRITES)
+        
+        assert app.write_multiple_requests == 1
+
+
+class BlockingApp(FakeApp):
+    """bacpypes3 application stub that never answers"""
+    
+    async def read_property(self, address, object_identifier, property_identifier):
+        await asyncio.Event().wait()
+
+
+async def submit_reads(client, requests, cancel=()):
+    """Queue reads on the client loop, cancel the waiters at ``cancel`` indexes, and gather the outcomes"""
+    futures = [client._submit_read(request) for request in requests]
+    for index in cancel:
+        futures[index].cancel()
+    return await asyncio.gather(*futures, return_exceptions=True)
+
+
+class TestReadBatching:
+    """Coalescing concurrent reads into ReadPropertyMultiple batches"""
+    
+    def test_coalesces_reads_queued_while_busy(self, tmp_path):
+        """Test reads queued behind an in-flight read go out as one request"""
+        app = FakeApp()
+        client = make_client(tmp_path / "caps.json", app)
+        
+        results = client._run_coroutine(submit_reads(client, present_values(5)), timeout=5)
+        
+        assert results == [float(instance) for instance in range(5)]
+        assert app.single_reads == 1
+        assert app.request_sizes == [4]
+    
+    def test_error_reaches_every_waiter(self, tmp_path):
+        """Test a failed batch raises its error in every queued read"""
+        client = make_client(tmp_path / "caps.json", FakeApp(abort="other"))
+        
+        results = client._run_coroutine(submit_reads(client, present_values(5)), timeout=5)
+        
+        assert all(isinstance(result, Exception) for result in results)
+    
+    def test_cancelled_waiter_does_not_affect_batch(self, tmp_path):
+        """Test cancelling one queued read leaves the others in its batch intact"""
+        client = make_client(tmp_path / "caps.json", FakeApp())
+        
+        results = client._run_coroutine(submit_reads(client, present_values(3), cancel=[1]), timeout=5)
+        
+        assert results[0] == 0.0
+        assert isinstance(results[1], asyncio.CancelledError)
+        assert results[2] == 2.0
+    
+    def test_cancelled_batch_cancels_waiters(self, tmp_path):
+        """Test cancelling an in-flight batch cancels its waiters instead of leaving them blocked"""
+        client = make_client(tmp_path / "caps.json", BlockingApp())
+        
+        async def _cancel_batch():
+            future = client._submit_read(("analogValue", 1, "presentValue"))
+            await asyncio.sleep(0)
+            for task in asyncio.all_tasks():
+                if task.get_coro().__qualname__.endswith("._read_batch"):
+                    task.cancel()
+            return (await asyncio.gather(future, return_exceptions=True))[0]
+        
+        result = client._run_coroutine(_cancel_batch(), timeout=5)
+        
+        assert isinstance(result, asyncio.CancelledError)
+
+
+class FakeClock:
+    """Monotonic clock advanced only by sleeps and simulated request time"""
+    
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+    
+    def monotonic(self):
+        return self.now
+    
+    async def sleep(self, delay):
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+class TestRetry:
+    """Exponential backoff and deadline of retried operations"""
+    
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        """Replace the client clock, asyncio.sleep and the retry jitter"""
+        clock = FakeClock()
+        monkeypatch.setattr(eventloop_bacnet_client, "time", clock)
+        monkeypatch.setattr(asyncio, "sleep", clock.sleep)
+        monkeypatch.setattr(eventloop_bacnet_client.random, "random", lambda: 0.0)
+        return clock
+    
+    @staticmethod
+    def operation(clock, failures, duration=1.0, error=NoResponseFromController):
+        """Operation taking ``duration`` seconds that fails ``failures`` times, then returns 'ok'"""
+        attempts = []
+        
+        async def _operation():
+            attempts.append(clock.now)
+            clock.now += duration
+            if len(attempts) <= failures:
+                raise error("no response")
+            return "ok"
+        
+        return _operation, attempts
+    
+    def test_delay_doubles_until_attempts_run_out(self, tmp_path, clock):
+        """Test every attempt is made with the delay doubling in between"""
+        client = make_client(tmp_path / "caps.json", FakeApp(), retry_count=4, retry_delay=0.5)
+        operation, attempts = self.operation(clock, failures=10)
+        
+        with pytest.raises(NoResponseFromController):
+            asyncio.run(client._retry(operation, "Read"))
+        
+        assert len(attempts) == 4
+        assert clock.sleeps == [0.5, 1.0, 2.0]
+    
+    def test_returns_first_success(self, tmp_path, clock):
+        """Test retrying stops at the first successful attempt"""
+        client = make_client(tmp_path / "caps.json", FakeApp(), retry_count=4, retry_delay=0.5)
+        operation, attempts = self.operation(clock, failures=2)
+        
+        assert asyncio.run(client._retry(operation, "Read")) == "ok"
+        assert len(attempts) == 3
+        assert clock.sleeps == [0.5, 1.0]
+    
+    def test_other_errors_not_retried(self, tmp_path, clock):
+        """Test errors other than timeouts are raised on the first attempt"""
+        client = make_client(tmp_path / "caps.json", FakeApp(), retry_count=4, retry_delay=0.5)
+        operation, attempts = self.operation(clock, failures=10, error=ValueError)
+        
+        with pytest.raises(ValueError):
+            asyncio.run(client._retry(operation, "Read"))
+        
+        assert len(attempts) == 1
+        assert clock.sleeps == []
+    
+    def test_stops_at_deadline(self, tmp_path, clock):
+        """Test no attempt starts after operation_timeout has passed"""
+        client = make_client(tmp_path / "caps.json", FakeApp(), retry_count=3, retry_delay=0.5)
+        operation, attempts = self.operation(clock, failures=10, duration=20.0)
+        
+        with pytest.raises(NoResponseFromController):
+            asyncio.run(client._retry(operation, "Read"))
+        
+        assert len(attempts) == 2
+        assert clock.sleeps == [0.5]
+        assert all(started < client.operation_timeout for started in attempts)
+
+
+class TestCOV:
+    """Serving presentValues from COV notifications"""
+    
+    @staticmethod
+    def subscribe(client):
+        """Subscribe to AnalogValue:1 and return the notification callback"""
+        callbacks = []
+        client.bacnet.cov = lambda address, object_identifier, lifetime, callback: callbacks.append(callback)
+        client.bacnet._last_cov_identifier = 1
+        client._run_coroutine(client._async_subscribe_cov(1, 900))
+        
+        present_value = PropertyIdentifier("presentValue")
+        return lambda value: callbacks[0](property_identifier=present_value, property_value=value)
+    
+    def test_ignores_old_value_after_write(self, tmp_path):
+        """Test a late notification of the value before a write is not cached"""
+        client = make_client(tmp_path / "caps.json", FakeApp())
+        notify = self.subscribe(client)
+        notify(10.0)
+        assert client.cov_cache[1][0] == 10.0
+        
+        client.write_analog_value(1, 20.0)
+        client.cov_events[1].clear()
+        notify(10.0)
+        
+        assert 1 not in client.cov_cache
+        assert not client.cov_events[1].is_set()
+        
+        notify(20.0)
+        
+        assert client.cov_cache[1][0] == 20.0
+        assert client.cov_events[1].is_set()
+    
+    def test_ignores_old_value_after_write_multiple(self, tmp_path):
+        """Test a late notification of the value before a WritePropertyMultiple is not cached"""
+        client = make_client(tmp_path / "caps.json", FakeApp())
+        notify = self.subscribe(client)
+        notify(10.0)
+        
+        client.write_multiple([("analogValue", 1, 20.0, None)])
+        notify(10.0)
+        
+        assert 1 not in client.cov_cache
+        
+        notify(20.0)
+        
+        assert client.cov_cache[1][0] == 20.0